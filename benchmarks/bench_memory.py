@@ -0,0 +1,118 @@
+"""Compare the memory per node of the compact Element with the previous layout.
+
+Usage
+-----
+    python benchmarks/bench_memory.py [--rows ROWS]
+
+Run it from the repository root with dictlistlib importable
+(e.g., after ``pip install -e .`` or with ``PYTHONPATH=.``).
+
+`LegacyElement` reproduces the node layout `Element` used before it
+switched to `__slots__`: a per-instance `__dict__` holding data, parent,
+index, type, on_exception, children and value, a `List` of children,
+and a formatted ``"__index__<i>"`` string per list item.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from dictlistlib.collection import Element
+from dictlistlib.collection import List
+
+
+class LegacyElement:
+    """Element node layout before the compact representation."""
+    def __init__(self, data, index='', parent=None, on_exception=False):
+        self.parent = parent
+        self.data = data
+        self.index = index
+        self.type = ''
+        self.on_exception = on_exception
+        self.children = None
+        self.value = None
+        if isinstance(data, dict):
+            self.type = 'dict'
+        elif isinstance(data, (list, tuple, set)):
+            self.type = 'list'
+        else:
+            self.type = type(data).__name__
+            self.value = data
+
+    @classmethod
+    def build(cls, data):
+        root = cls(data)
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.type == 'dict':
+                items = node.data.items()
+            elif node.type == 'list':
+                items = (('__index__{}'.format(i), item)
+                         for i, item in enumerate(node.data))
+            else:
+                continue
+            lst = List()
+            for index, val in items:
+                elm = cls(val, index=index, parent=node)
+                lst.append(elm)
+                stack.append(elm)
+            node.children = lst or None
+        return root
+
+
+def make_list_of_dict(rows):
+    """Return a list of inventory-like dictionaries."""
+    return [
+        {
+            'name': 'GigabitEthernet0/{}'.format(i),
+            'mtu': 1500,
+            'status': 'up' if i % 3 else 'down',
+            'description': 'link {}'.format(i),
+            'counters': {'in_errors': i % 7, 'out_errors': i % 5},
+        }
+        for i in range(rows)
+    ]
+
+
+def count_nodes(root):
+    total, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        total += 1
+        stack.extend(node.children or [])
+    return total
+
+
+def measure(builder, data):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    root = builder(data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return size, count_nodes(root)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    options = parser.parse_args()
+
+    data = make_list_of_dict(options.rows)
+    legacy_size, legacy_nodes = measure(LegacyElement.build, data)
+    compact_size, compact_nodes = measure(Element, data)
+    assert legacy_nodes == compact_nodes
+
+    fmt = '{:<16} {:>12,} bytes {:>10,} nodes {:>8.1f} bytes/node'
+    print('list of {} dictionaries'.format(options.rows))
+    print(fmt.format('legacy layout', legacy_size, legacy_nodes,
+                     legacy_size / legacy_nodes))
+    print(fmt.format('compact layout', compact_size, compact_nodes,
+                     compact_size / compact_nodes))
+    print('reduction: {:.1%}'.format(1 - compact_size / legacy_size))
+
+
+if __name__ == '__main__':
+    main()
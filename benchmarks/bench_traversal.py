@@ -0,0 +1,94 @@
+"""Benchmark recursive versus stack-based traversal on deep, narrow data.
+
+Usage
+-----
+    python benchmarks/bench_traversal.py [--depth DEPTH] [--repeat REPEAT]
+
+Run it from the repository root with dictlistlib importable
+(e.g., after ``pip install -e .`` or with ``PYTHONPATH=.``).
+
+The recursive reference below is the traversal that `Element.find_`
+used before it switched to an explicit stack.  It is kept here only to
+measure against; it cannot handle data nested deeper than the
+interpreter recursion limit.
+"""
+
+import argparse
+import sys
+import timeit
+
+from dictlistlib.collection import Element
+from dictlistlib.collection import LookupCls
+from dictlistlib.collection import List
+
+
+def make_deep_data(depth):
+    """Return `depth` levels of nested dictionaries."""
+    node = {'name': 'leaf', 'value': depth}
+    for i in range(depth - 1, -1, -1):
+        node = {'name': 'level{}'.format(i), 'value': i, 'child': node}
+    return node
+
+
+def recursive_find_(node, lookup_obj, result):
+    """Recursive reference implementation of `Element.find_`."""
+    if node.is_dict or node.is_list:
+        for child in node.children or []:
+            if node.is_list:
+                if child.is_element:
+                    recursive_find_(child, lookup_obj, result)
+            else:
+                if lookup_obj.is_left_matched(child.index):
+                    if lookup_obj.is_right:
+                        if lookup_obj.is_right_matched(child.data):
+                            result.append(child)
+                    else:
+                        result.append(child)
+                if child.is_element:
+                    recursive_find_(child, lookup_obj, result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--depth', type=int, default=250)
+    parser.add_argument('--repeat', type=int, default=50)
+    options = parser.parse_args()
+
+    data = make_deep_data(options.depth)
+    elm = Element(data)
+    lookup_obj = LookupCls('value')
+
+    def run_recursive():
+        recursive_find_(elm, lookup_obj, List())
+
+    def run_iterative():
+        elm.find_(elm, lookup_obj, List())
+
+    def run_raw():
+        elm.find_raw_(data, lookup_obj, List())
+
+    expected, result = List(), List()
+    recursive_find_(elm, lookup_obj, expected)
+    elm.find_(elm, lookup_obj, result)
+    assert [r.data for r in expected] == [r.data for r in result]
+
+    fmt = '{:<28} {:>10.3f} ms/run'
+    print('depth={}, repeat={}'.format(options.depth, options.repeat))
+    for name, func in [('recursive Element.find_', run_recursive),
+                       ('stack-based Element.find_', run_iterative),
+                       ('stack-based find_raw_', run_raw)]:
+        seconds = min(timeit.repeat(func, number=options.repeat, repeat=5))
+        print(fmt.format(name, seconds * 1000 / options.repeat))
+
+    very_deep = max(sys.getrecursionlimit() * 5, 5000)
+    deep_data = make_deep_data(very_deep)
+    total = len(Element(deep_data).find('value'))
+    print('depth={}: stack-based find returned {} records'.format(very_deep, total))
+    try:
+        recursive_find_(Element(deep_data, lazy=True), lookup_obj, List())
+    except RecursionError as ex:
+        print('depth={}: recursive find_ raised {}'.format(very_deep, type(ex).__name__))
+
+
+if __name__ == '__main__':
+    main()
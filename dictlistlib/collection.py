@@ -10,10 +10,15 @@ imports supporting utilities, parsers, and validation helpers from
 import yaml
 import json
 import re
+import heapq
+from collections import namedtuple
 from functools import partial
+from itertools import islice
 from dictlistlib.argumenthelper import validate_argument_type
+from dictlistlib.argumenthelper import validate_argument_choice
 from dictlistlib import utils
 from dictlistlib.parser import SelectParser
+from dictlistlib.predicate import Predicate
 from dictlistlib.validation import OpValidation
 from dictlistlib.validation import CustomValidation
 
@@ -21,6 +26,19 @@ from dictlistlib.exceptions import ListIndexError
 from dictlistlib.exceptions import ResultError
 from dictlistlib.exceptions import LookupClsError
 from dictlistlib.exceptions import ObjectArgumentError
+from dictlistlib.exceptions import ArgumentValidationError
+
+# marker of a lazy Element whose children are not created yet
+_UNBUILT = object()
+
+# bit flags of Element
+_ON_EXCEPTION = 1
+_LAZY = 2
+
+# shared type names of scalar Element, one string instance per type
+_TYPE_NAMES = {
+    int: 'int', float: 'float', bool: 'bool', str: 'str', type(None): 'NoneType'
+}
 
 
 class List(list):
@@ -187,7 +205,14 @@ class Result:
     ------
     ResultError
         If the provided parent is not None or an instance of Result.
+
+    Notes
+    -----
+    - Instances use `__slots__` instead of a per-instance `__dict__`,
+      because a query may create one `Result` per matched record.
     """
+    __slots__ = ('parent', 'data')
+
     def __init__(self, data, parent=None):
         self.parent = None
         self.data = data
@@ -261,6 +286,10 @@ class Element(Result):
     on_exception : bool
         If True, exceptions are raised during operations. If False,
         operations return gracefully without raising.
+    lazy : bool
+        If True, child elements are only created when `children` is
+        first accessed (e.g., when `find_` descends into the node).
+        Defaults to False, which builds the whole tree up front.
     type : str
         A string representation of the data type (e.g., "dict", "list",
         "int", "str", "object").
@@ -269,18 +298,27 @@ class Element(Result):
     -----
     - Iterable data (lists, tuples, sets, dicts) are converted into
       child `Element` instances accessible via `children`.
-    - Scalar values (int, float, bool, str, None) are stored directly
-      in `value`.
+    - In lazy mode, the cost of wrapping data follows the part of the
+      tree that is actually visited rather than the size of the data.
+    - Scalar values (int, float, bool, str, None) are available
+      through `value`.
     - Provides convenience properties such as `is_leaf`, `is_scalar`,
       `is_list`, and `is_dict` for type checks.
     - Supports recursive search and filtering using `find` and
       `filter_result`.
+    - The node layout is compact: `__slots__` instead of `__dict__`,
+      a tuple of children, shared type name strings, `on_exception`
+      and `lazy` packed into one flags slot, and list positions kept
+      as integers until `index` is read.
     """
-    def __init__(self, data, index='', parent=None, on_exception=False):
+    __slots__ = ('_index', 'type', '_flags', '_children')
+
+    def __init__(self, data, index='', parent=None, on_exception=False,
+                 lazy=False):
         super().__init__(data, parent=parent)
-        self.index = index
+        self._index = index
         self.type = ''
-        self.on_exception = on_exception
+        self._flags = (_ON_EXCEPTION if on_exception else 0) | (_LAZY if lazy else 0)
         self._build(data)
 
     def __iter__(self):
@@ -374,46 +412,162 @@ class Element(Result):
             index (`"__index__<i>"`). The element type is set to `"list"`.
         - If `data` is a scalar (int, float, bool, str, or None):
             The element type is set to the scalar type name, and the value is
-            stored directly in `self.value`.
+            available through `self.value`.
         - For all other types:
-            The element type is set to `"object"`, and the value stores
-            directly in `self.value`.
+            The element type is set to `"object"`, and the value is
+            available through `self.value`.
+        - If the element is lazy, child elements of a dict or list are
+          not created here but on first access of `children`.
 
         Attributes Set
         --------------
-        children : List or None
-            A list of child `Element` instances if the data is composite,
-            otherwise None.
-        value : Any or None
-            The scalar or object value if the data is non-composite,
+        children : tuple or None
+            A tuple of child `Element` instances if the data is composite,
             otherwise None.
         type : str
             A string describing the type of the data ("dict", "list",
             scalar type name, or "object").
         """
-        self.children = None
-        self.value = None
+        self._children = None
         if isinstance(data, dict):
             self.type = 'dict'
-            lst = List()
-            for index, val in data.items():
-                elm = Element(val, index=index, parent=self)
-                lst.append(elm)
-            self.children = lst or None
+            self._children = _UNBUILT
         elif isinstance(data, (list, tuple, set)):
             self.type = 'list'
-            lst = List()
-            for i, item in enumerate(data):
-                index = '__index__{}'.format(i)
-                elm = Element(item, index=index, parent=self)
-                lst.append(elm)
-            self.children = lst or None
+            self._children = _UNBUILT
         elif isinstance(data, (int, float, bool, str)) or data is None:
-            self.type = type(data).__name__
-            self.value = data
+            self.type = _TYPE_NAMES.get(type(data)) or type(data).__name__
         else:
             self.type = 'object'
-            self.value = data
+
+        if not self.lazy:
+            self._build_children()
+
+    def _build_children(self):
+        """
+        Create the child elements of a dict or list element.
+
+        Each key-value pair of a dict becomes a child `Element` whose
+        index is the key.  Each item of a list, tuple, or set becomes
+        a child `Element` whose index is ``"__index__<i>"``.  Children
+        inherit the `lazy` flag of their parent, so a lazy tree only
+        materializes the nodes that are visited.
+
+        Notes
+        -----
+        - A non-lazy tree is built with an explicit stack instead of
+          recursion, so deeply nested data does not hit the
+          interpreter recursion limit.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._children is not _UNBUILT:
+                continue
+
+            if node.type == 'dict':
+                items = node.data.items()
+            else:
+                items = enumerate(node.data)
+
+            lst = []
+            for index, val in items:
+                # child is created unbuilt, then built by this loop
+                elm = Element(val, index=index, parent=node, lazy=True)
+                elm.lazy = node.lazy
+                if not elm.lazy and elm._children is _UNBUILT:
+                    stack.append(elm)
+                lst.append(elm)
+            node._children = tuple(lst) or None
+
+    @property
+    def on_exception(self):
+        """
+        bool: True if exceptions are raised during operations.
+        """
+        return bool(self._flags & _ON_EXCEPTION)
+
+    @on_exception.setter
+    def on_exception(self, value):
+        if value:
+            self._flags |= _ON_EXCEPTION
+        else:
+            self._flags &= ~_ON_EXCEPTION
+
+    @property
+    def lazy(self):
+        """
+        bool: True if child elements are created on first access.
+        """
+        return bool(self._flags & _LAZY)
+
+    @lazy.setter
+    def lazy(self, value):
+        if value:
+            self._flags |= _LAZY
+        else:
+            self._flags &= ~_LAZY
+
+    @property
+    def index(self):
+        """
+        Return the index or key of the element within its parent.
+
+        Returns
+        -------
+        Any
+            The key if the parent data is a dictionary, or
+            ``"__index__<i>"`` if the parent data is a list.
+        """
+        parent = self.parent
+        if parent is not None and parent.type == 'list':
+            return '__index__{}'.format(self._index)
+        return self._index
+
+    @property
+    def value(self):
+        """
+        Return the scalar or object value of a non-composite element.
+
+        Returns
+        -------
+        Any or None
+            The underlying data if the element is not a dict or list,
+            otherwise None.
+        """
+        if self.type in ('dict', 'list'):
+            return None
+        return self.data
+
+    @property
+    def is_built(self):
+        """
+        Check whether the child elements have been created.
+
+        Returns
+        -------
+        bool
+            False if the element is lazy and its children have not
+            been accessed yet, otherwise True.
+        """
+        return self._children is not _UNBUILT
+
+    @property
+    def children(self):
+        """
+        Return the child elements of a dict or list element.
+
+        For a lazy element, the children are created on first access.
+
+        Returns
+        -------
+        tuple or None
+            A tuple of child `Element` instances if the data is a non-empty
+            composite, otherwise None.
+        """
+        if self._children is _UNBUILT:
+            self._build_children()
+        return self._children
 
     @property
     def has_children(self):
@@ -429,7 +583,9 @@ class Element(Result):
         bool
             True if the element has one or more children, otherwise False.
         """
-        return bool(self.children)
+        if self._children is _UNBUILT:
+            return bool(self.data)
+        return bool(self._children)
 
     @property
     def is_element(self):
@@ -503,7 +659,7 @@ class Element(Result):
         """
         return self.type == 'dict'
 
-    def filter_result(self, records, select_statement):
+    def filter_result(self, records, select_statement, as_tuples=False):
         """
         Apply a selection filter to a list of records.
 
@@ -515,9 +671,13 @@ class Element(Result):
         ----------
         records : List[Element]
             A list of `Element` records to be filtered.
-        select_statement : str
+        select_statement : str or SelectParser
             A selection expression used to determine which records or fields
-            should be included in the result. Parsed by `SelectParser`.
+            should be included in the result. Parsed by `SelectParser`, or
+            a `SelectParser` whose statement is already parsed.
+        as_tuples : bool, optional
+            If True, selected columns are returned as namedtuples instead
+            of dictionaries. Default is False.
 
         Returns
         -------
@@ -540,47 +700,250 @@ class Element(Result):
         - The `SelectParser` is responsible for interpreting the select statement
           and generating a predicate function.
         - When no predicate is defined, all records are included by default.
-        - Column filtering ensures missing keys are set to `None`.
+        - Records missing any selected column are left out.  The columns
+          are projected by `SelectParser.get_projection`.
+        """
+        plan = QueryPlan.resolve('', select_statement,
+                                 on_exception=self.on_exception)
+        result = List(self.filter_columns_(records, plan.select_obj,
+                                           as_tuples=as_tuples))
+        return result
+
+    def iter_filter_result(self, records, select_obj, as_tuples=False):
         """
-        result = List()
-        select_obj = SelectParser(select_statement,
-                                  on_exception=self.on_exception)
-        select_obj.parse_statement()
+        Lazily apply a parsed selection filter to an iterable of records.
 
-        if callable(select_obj.predicate):
-            lst = List()
-            for record in records:
-                is_found = select_obj.predicate(record.parent.data,
-                                                on_exception=self.on_exception)
-                if is_found:
-                    lst.append(record)
-        else:
-            lst = records[:]
+        This is the streaming counterpart of `filter_result`. Records are
+        consumed one at a time, so it can be fed directly from a traversal
+        generator and stopped as soon as enough results are produced.
+
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The matched records to filter and project.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+        as_tuples : bool, optional
+            If True, project columns onto namedtuples. Default is False.
+
+        Returns
+        -------
+        iterator
+            The projected result of each record that satisfies the
+            predicate, in the same form as `filter_result` returns.
+        """
+        predicate = select_obj.predicate
+        if callable(predicate):
+            records = (
+                record for record in records
+                if predicate(record.parent.data, on_exception=self.on_exception)
+            )
+        return self.iter_select_result_(records, select_obj, as_tuples=as_tuples)
+
+    def iter_select_result_(self, records, select_obj, as_tuples=False):
+        """
+        Group, order, limit, and project records that satisfy the predicate.
+
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The records that satisfy the predicate.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+        as_tuples : bool, optional
+            If True, return namedtuples instead of dictionaries of
+            columns. Default is False.
+
+        Returns
+        -------
+        iterator
+            The projected records, or one aggregated row per group if
+            the statement has ``GROUP BY`` or aggregate columns.
+        """
+        if not select_obj.is_aggregate_select:
+            if select_obj.is_distinct:
+                records = self.iter_distinct_records_(records, select_obj)
+            records = self.iter_order_records_(records, select_obj)
+            return self.iter_project_result_(records, select_obj, as_tuples=as_tuples)
+
+        rows = select_obj.aggregate(record.parent.data for record in records)
+        rows = list(self.iter_order_records_(rows, select_obj, is_row=True))
+        if as_tuples and rows:
+            row_type = namedtuple('Row', rows[0], rename=True)
+            rows = [row_type._make(row.values()) for row in rows]
+        return iter(rows)
+
+    def iter_distinct_records_(self, records, select_obj):     # noqa
+        """
+        Lazily drop the records that repeat an earlier ``DISTINCT`` key.
+
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The records that satisfy the predicate.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+
+        Yields
+        ------
+        Element or Result
+            The first record of each distinct key, see
+            `SelectParser.get_distinct_key`, in traversal order.  Keys
+            are kept in a set, so each record is checked in constant
+            time.
+        """
+        get_key = select_obj.get_distinct_key()
+        seen = set()
+        for record in records:
+            parent = None if record.parent is None else record.parent.data
+            key = get_key(record.data, parent)
+            if key is not None and key not in seen:
+                seen.add(key)
+                yield record
+
+    def iter_order_records_(self, records, select_obj, is_row=False):     # noqa
+        """
+        Apply the ``ORDER BY`` and ``LIMIT`` clauses of a select statement.
 
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The records that satisfy the predicate.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+        is_row : bool, optional
+            If True, the records are dictionaries, e.g., aggregated rows,
+            sorted by their own data. Default is False.
+
+        Returns
+        -------
+        iterator
+            The records sorted by the parent data of each record, and
+            sliced by the limit and offset.
+
+        Notes
+        -----
+        - With a limit, only the first ``offset + limit`` records are
+          kept, in a bounded heap by `heapq.nsmallest`, so memory stays
+          proportional to the limit rather than to the matches.
+        - Records with equal sort keys keep their traversal order.
+        """
+        start, limit = select_obj.offset, select_obj.limit
+        stop = None if limit is None else start + limit
+        if select_obj.order_by:
+            get_key = select_obj.get_order_key()
+
+            def key(record):
+                return get_key(record if is_row else record.parent.data)
+
+            if stop is None:
+                records = sorted(records, key=key)
+            else:
+                records = heapq.nsmallest(stop, records, key=key)
+        elif not start and stop is None:
+            return records
+        return islice(records, start, stop)
+
+    def filter_columns_(self, records, select_obj, as_tuples=False):
+        """
+        Apply a parsed selection filter to records, column by column.
+
+        This is the batch counterpart of `iter_filter_result`.  The
+        records are collected first, and the predicate is evaluated over
+        the distinct parent dictionaries at once by
+        `SelectParser.evaluate_columns`.
+
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The matched records to filter and project.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+        as_tuples : bool, optional
+            If True, project columns onto namedtuples. Default is False.
+
+        Returns
+        -------
+        list
+            The projected result of each record that satisfies the
+            predicate, the same as `iter_filter_result` yields.
+
+        Notes
+        -----
+        - A clause whose predicate raises an exception, with
+          `on_exception` set, is evaluated again record by record by
+          `iter_filter_result`, so the error surfaces as before.
+        - A statement with a ``LIMIT``, ``GROUP BY``, or aggregate column
+          is streamed by `iter_filter_result` instead, so memory stays
+          bounded by the limit or the number of groups.
+        """
+        is_streamed = select_obj.limit is not None or select_obj.is_aggregate_select
+        if not callable(select_obj.predicate) or is_streamed:
+            # a limit is applied while streaming, keeping memory bounded
+            return list(self.iter_filter_result(records, select_obj,
+                                                as_tuples=as_tuples))
+
+        records = list(records)
+
+        rows, positions = [], dict()
+        for record in records:
+            data = record.parent.data
+            if id(data) not in positions:
+                positions[id(data)] = len(rows)
+                rows.append(data)
+
+        mask = select_obj.evaluate_columns(rows, on_exception=self.on_exception)
+        if mask is None:
+            return list(self.iter_filter_result(records, select_obj,
+                                                as_tuples=as_tuples))
+
+        records = [
+            record for record in records
+            if mask[positions[id(record.parent.data)]]
+        ]
+        return list(self.iter_select_result_(records, select_obj,
+                                             as_tuples=as_tuples))
+
+    def iter_project_result_(self, records, select_obj, as_tuples=False):    # noqa
+        """
+        Lazily project records by the columns of a select statement.
+
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The records that satisfy the predicate.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+        as_tuples : bool, optional
+            If True, project columns onto namedtuples. Default is False.
+
+        Yields
+        ------
+        Any
+            The record data, its parent data, or the selected columns
+            of its parent data, skipping records missing any column.
+        """
         if select_obj.is_zero_select:
-            for item in lst:
-                result.append(item.data)
+            for record in records:
+                yield record.data
         elif select_obj.is_all_select:
-            for item in lst:
-                result.append(item.parent.data)
+            for record in records:
+                yield record.parent.data
         else:
-            for item in lst:
-                new_data = item.parent.data.fromkeys(select_obj.columns)
-                is_added = True
-                for key in new_data:
-                    is_added &= key in item.parent.data
-                    new_data[key] = item.parent.data.get(key, None)
-                is_added and result.append(new_data)
-        return result
+            projection = select_obj.get_projection(as_tuples=as_tuples)
+            for record in records:
+                new_data = projection(record.parent.data)
+                if new_data is not None:
+                    yield new_data
 
     def find_(self, node, lookup_obj, result):
         """
-        Recursively traverse an element tree to locate records matching a lookup.
+        Traverse an element tree to locate records matching a lookup.
 
         This helper method walks through the children of a given `Element`
         node, applying lookup rules to determine whether each child should
         be added to the result set. It supports both dictionary and list
-        structures, and continues recursion into nested elements.
+        structures, and continues into nested elements.
 
         Parameters
         ----------
@@ -597,31 +960,337 @@ class Element(Result):
 
         Notes
         -----
-        - For list nodes, recursion continues into child elements without
+        - For list nodes, traversal continues into child elements without
           applying key/value matching.
         - For dict nodes, the child's index (key) is checked against the
           left-hand lookup condition. If matched, the right-hand condition
           (if present) is applied to the child's data.
         - Matching children are appended directly to the `result` list.
-        - Recursion proceeds into child elements if they themselves contain
-          nested structures.
-        """
-        if node.is_dict or node.is_list:
-            for child in node.children:
-                if node.is_list:
-                    if child.is_element:
-                        self.find_(child, lookup_obj, result)
-                else:
+        - Nested elements are visited depth-first with an explicit stack
+          of child iterators, so the match order is the same as a recursive
+          walk, but deeply nested data does not raise `RecursionError`.
+        """
+        result.extend(self.iter_find_(node, lookup_obj))
+
+    def iter_find_(self, node, lookup_obj, index=None):
+        """
+        Lazily traverse an element tree and yield records matching a lookup.
+
+        This is the generator behind `find_`. Matches are produced in the
+        same depth-first order, and the traversal stops as soon as the
+        caller stops consuming the generator.
+
+        Parameters
+        ----------
+        node : Element
+            The `Element` node whose descendants are searched.
+        lookup_obj : LookupCls
+            A `LookupCls` instance that defines the matching rules.
+        index : KeyIndex, optional
+            A key index of the data. Subtrees whose key summary has no
+            key matching the lookup are skipped. Default is None.
+
+        Yields
+        ------
+        Element
+            Each matching child element.
+        """
+        if not (node.is_dict or node.is_list):
+            return
+
+        is_skipped = self.get_subtree_filter_(index, lookup_obj)
+        if is_skipped and is_skipped(node.data):
+            return
+
+        stack = [(node.is_list, iter(node.children or []))]
+        while stack:
+            is_list, children = stack[-1]
+            for child in children:
+                if not is_list:
                     if lookup_obj.is_left_matched(child.index):
                         if lookup_obj.is_right:
                             if lookup_obj.is_right_matched(child.data):
-                                result.append(child)
+                                yield child
                         else:
-                            result.append(child)
-                    if child.is_element:
-                        self.find_(child, lookup_obj, result)
+                            yield child
+                if child.is_element:
+                    if is_skipped and is_skipped(child.data):
+                        continue
+                    stack.append((child.is_list, iter(child.children)))
+                    break
+            else:
+                stack.pop()
+
+    def find_raw_(self, data, lookup_obj, result):
+        """
+        Traverse raw dict/list data to locate records matching a lookup.
+
+        This helper method is the wrapper-free counterpart of `find_`. It
+        walks the underlying dictionaries and lists directly instead of
+        child `Element` instances, and it only allocates a lightweight
+        `Result` record for each match, whose parent is a `Result`
+        holding the matched dictionary.
+
+        Parameters
+        ----------
+        data : Any
+            The current data to inspect. Only dict and list (tuple, set)
+            data are traversed.
+        lookup_obj : LookupCls
+            A `LookupCls` instance that defines the matching rules.
+        result : List
+            A mutable list used to collect matching `Result` records. This
+            list is updated in place as matches are found.
+
+        Notes
+        -----
+        - The match order is identical to `find_`, so both traversals
+          produce the same records for `filter_result`.
+        - Like `find_`, nested data is visited with an explicit stack.
+        """
+        result.extend(self.iter_find_raw_(data, lookup_obj))
+
+    def iter_find_raw_(self, data, lookup_obj, index=None):
+        """
+        Lazily traverse raw dict/list data and yield records matching a lookup.
+
+        This is the generator behind `find_raw_`. Matches are produced in
+        the same order as `iter_find_`, and the traversal stops as soon as
+        the caller stops consuming the generator.
+
+        Parameters
+        ----------
+        data : Any
+            The data whose nested dictionaries and lists are searched.
+        lookup_obj : LookupCls
+            A `LookupCls` instance that defines the matching rules.
+        index : KeyIndex, optional
+            A key index of the data, used like in `iter_find_`.
+            Default is None.
 
-    def find(self, lookup, select=''):
+        Yields
+        ------
+        Result
+            A record for each match, whose parent holds the matched dictionary.
+        """
+        containers = (dict, list, tuple, set)
+        if not isinstance(data, containers):
+            return
+
+        is_skipped = self.get_subtree_filter_(index, lookup_obj)
+        if is_skipped and is_skipped(data):
+            return
+
+        def new_frame(data_):
+            # frame: [data, parent record, iterator, is_dict]
+            if isinstance(data_, dict):
+                return [data_, None, iter(data_.items()), True]
+            return [data_, None, iter(data_), False]
+
+        stack = [new_frame(data)]
+        while stack:
+            frame = stack[-1]
+            for entry in frame[2]:
+                if frame[3]:
+                    key, val = entry
+                    if lookup_obj.is_left_matched(key):
+                        if lookup_obj.is_right_matched(val):
+                            if frame[1] is None:
+                                frame[1] = Result(frame[0])
+                            yield Result(val, parent=frame[1])
+                else:
+                    val = entry
+                if isinstance(val, containers) and val:
+                    if is_skipped and is_skipped(val):
+                        continue
+                    stack.append(new_frame(val))
+                    break
+            else:
+                stack.pop()
+
+    def iter_find_many_raw_(self, data, lookup_objs):
+        """
+        Traverse raw dict/list data once and yield matches of many lookups.
+
+        Every dictionary key is checked against all lookups in the same
+        visit with a `MultiLookupCls`, so the data is walked once however
+        many lookups there are.
+
+        Parameters
+        ----------
+        data : Any
+            The data whose nested dictionaries and lists are searched.
+        lookup_objs : list of LookupCls
+            The `LookupCls` instances that define the matching rules.
+
+        Yields
+        ------
+        tuple
+            An ``(i, record)`` tuple for each match, where ``i`` is the
+            position of the matching lookup in `lookup_objs` and
+            ``record`` is a `Result` like `iter_find_raw_` yields.  The
+            records of each lookup are in the same order as
+            `iter_find_raw_`.
+        """
+        containers = (dict, list, tuple, set)
+        if not isinstance(data, containers):
+            return
+
+        matcher = MultiLookupCls(lookup_objs)
+
+        def new_frame(data_):
+            # frame: [data, parent record, iterator, is_dict]
+            if isinstance(data_, dict):
+                return [data_, None, iter(data_.items()), True]
+            return [data_, None, iter(data_), False]
+
+        stack = [new_frame(data)]
+        while stack:
+            frame = stack[-1]
+            for entry in frame[2]:
+                if frame[3]:
+                    key, val = entry
+                    for i in matcher.match(key):
+                        if matcher.lookup_objs[i].is_right_matched(val):
+                            if frame[1] is None:
+                                frame[1] = Result(frame[0])
+                            yield i, Result(val, parent=frame[1])
+                else:
+                    val = entry
+                if isinstance(val, containers) and val:
+                    stack.append(new_frame(val))
+                    break
+            else:
+                stack.pop()
+
+    def get_subtree_filter_(self, index, lookup_obj):     # noqa
+        """
+        Build a check of whether a subtree can be skipped by a lookup.
+
+        The keys of the index matching the left-hand lookup are computed
+        once, and a subtree can be skipped if its key summary, i.e., all
+        string keys below it, has none of those keys.
+
+        Parameters
+        ----------
+        index : KeyIndex or None
+            A key index of the data.
+        lookup_obj : LookupCls
+            A `LookupCls` instance that defines the matching rules.
+
+        Returns
+        -------
+        callable or None
+            A function taking dict/list data and returning True if the
+            data has no match, or None if no subtree can be skipped,
+            i.e., there is no index or no left-hand lookup.
+        """
+        if index is None or not lookup_obj.left:
+            return None
+
+        matched_keys = {k for k in index.keys() if lookup_obj.is_left_matched(k)}
+
+        def is_skipped(data):
+            summary = index.get_summary(data)
+            return summary is not None and summary.isdisjoint(matched_keys)
+        return is_skipped
+
+    def iter_find_index_(self, index, lookup_obj):
+        """
+        Yield records matching a literal-key lookup from a key index.
+
+        The locations of the literal key are read from the index instead
+        of traversing the data, so the cost follows the number of matches
+        rather than the size of the data.  If the right-hand lookup is a
+        literal too, the locations of the value are read from the value
+        index of the key, and if it is a numeric comparison such as
+        ``gt(1500)``, they are read from the sorted numbers of the key.
+
+        Parameters
+        ----------
+        index : KeyIndex
+            A key index of the data.
+        lookup_obj : LookupCls
+            A `LookupCls` instance whose `left_literal` is not None.
+
+        Yields
+        ------
+        Result
+            A record for each match, whose parent holds the matched
+            dictionary, in the same order as `iter_find_raw_`.
+        """
+        key = lookup_obj.left_literal
+        locations = index.get(key)
+        literal, right = lookup_obj.right_literal, lookup_obj.right
+        if literal is not None:
+            values = index.get_values(key)
+            if literal + '\n' not in values:
+                locations = values.get(literal, [])
+        elif isinstance(right, partial) and right.func == OpValidation.compare_number:
+            try:
+                locations = index.compare_number(key, right.keywords['op'],
+                                                 right.keywords['other'])
+            except Exception:   # noqa
+                pass
+
+        parents = dict()
+        for parent, val in locations:
+            if lookup_obj.is_right_matched(val):
+                parent_record = parents.get(id(parent))
+                if parent_record is None:
+                    parent_record = parents[id(parent)] = Result(parent)
+                yield Result(val, parent=parent_record)
+
+    def iter_prefilter_index_(self, records, index, select_obj):
+        """
+        Drop records that a ``WHERE`` equality or numeric predicate rejects.
+
+        If the predicate of the select statement is a single string
+        equality such as ``status == up``, the dictionaries holding the
+        value are read from the value index of the key.  If it is a
+        single numeric comparison such as ``cpu_load > 80``, they are read
+        from the sorted numbers of the key.  The records of other
+        dictionaries are dropped without evaluating the predicate.
+
+        Parameters
+        ----------
+        records : iterable of Element or Result
+            The matched records.
+        index : KeyIndex
+            A key index of the data.
+        select_obj : SelectParser
+            A `SelectParser` instance whose statement is already parsed.
+
+        Returns
+        -------
+        iterable of Element or Result
+            The records whose parent dictionary may satisfy the predicate.
+        """
+        predicate = select_obj.predicate
+        if not isinstance(predicate, partial):
+            return records
+
+        func, kwargs = predicate.func, predicate.keywords
+        if func == Predicate.compare and kwargs.get('op') == 'eq':
+            if str(kwargs['other']).upper() == '__EXCEPTION__':
+                return records
+            locations = index.get_values(kwargs['key']).get(kwargs['other'], [])
+        elif func == Predicate.compare_number and not self.on_exception:
+            # a failed conversion must still raise when on_exception is set
+            try:
+                locations = index.compare_number(kwargs['key'], kwargs['op'],
+                                                  kwargs['other'])
+            except Exception:   # noqa
+                return records
+        else:
+            return records
+
+        parent_ids = {id(parent) for parent, _ in locations}
+        result = (r for r in records if id(r.parent.data) in parent_ids)
+        return result
+
+    def find(self, lookup, select='', engine='element', index=None,
+             as_tuples=False):
         """
          Recursively search for elements matching a lookup expression.
 
@@ -631,14 +1300,28 @@ class Element(Result):
 
          Parameters
          ----------
-         lookup : str
+         lookup : str or QueryPlan
              A lookup expression or search pattern used to locate matching
-             elements within the hierarchy. Parsed by `LookupCls`.
-         select : str, optional
+             elements within the hierarchy. Parsed by `LookupCls`.  A
+             `QueryPlan` carries both the lookup and the select statement.
+         select : str or SelectParser, optional
              A select statement that determines how the matched records
              should be returned (e.g., raw data, parent data, or specific
-             columns). Defaults to an empty string, meaning no additional
+             columns), or a `SelectParser` whose statement is already
+             parsed. Defaults to an empty string, meaning no additional
              filtering.
+         engine : str, optional
+             The traversal engine. ``"element"`` (default) walks the
+             `Element` tree via `find_`. ``"raw"`` walks the underlying
+             dict/list data via `find_raw_` without building child
+             elements. Both engines return the same result.
+         index : KeyIndex, optional
+             A key index of the element data. When the left-hand lookup
+             is a literal key, matches are read from the index instead
+             of traversing the data. Default is None.
+         as_tuples : bool, optional
+             If True, selected columns are returned as namedtuples
+             instead of dictionaries. Default is False.
 
          Returns
          -------
@@ -648,19 +1331,210 @@ class Element(Result):
              - Without a select statement, returns matching `Element` records.
              - With `is_zero_select`, returns the `data` of each record.
              - With `is_all_select`, returns the `parent.data` of each record.
-             - With column selection, returns dictionaries containing only
-               the specified columns.
+             - With column selection, returns dictionaries, or namedtuples
+               if `as_tuples` is True, containing only the specified
+               columns.
+
+         Raises
+         ------
+         ArgumentValidationError
+             If `engine` is not ``"element"`` or ``"raw"``, or `lookup`
+             is a `QueryPlan` and `select` is not empty.
 
          Notes
          -----
-         - Internally, this method delegates recursive traversal to `find_`.
-         - Filtering and projection of results are handled by `filter_result`.
+         - Internally, this method collects the records of `iterfind`.
+         - Filtering and projection of results are handled by
+           `filter_columns_`, which evaluates the predicate column by
+           column over all matched records.
          - Useful for querying nested structures such as lists and dictionaries.
          """
-        records = List()
-        lkup_obj = LookupCls(lookup)
-        self.find_(self, lkup_obj, records)
-        result = self.filter_result(records, select)
+        validate_argument_choice(engine=(engine, ('element', 'raw')))
+        plan = QueryPlan.resolve(lookup, select, on_exception=self.on_exception)
+        records = self.iter_find_records_(plan.lookup_obj, plan.select_obj,
+                                          engine=engine, index=index)
+        result = List(self.filter_columns_(records, plan.select_obj,
+                                           as_tuples=as_tuples))
+        return result
+
+    def iterfind(self, lookup, select='', engine='element', limit=None,
+                 index=None, as_tuples=False):
+        """
+        Lazily search for elements matching a lookup expression.
+
+        This method returns an iterator that yields the same results as
+        `find`, in the same order, but produces each result as soon as it
+        is found. Traversal of the remaining data stops once `limit`
+        results are yielded or the caller stops iterating.
+
+        Parameters
+        ----------
+        lookup : str or QueryPlan
+            A lookup expression parsed by `LookupCls`, or the `QueryPlan`
+            of the whole query.
+        select : str or SelectParser, optional
+            A select statement parsed by `SelectParser`, or a
+            `SelectParser` whose statement is already parsed. Default is ''.
+        engine : str, optional
+            The traversal engine, ``"element"`` (default) or ``"raw"``.
+        limit : int, optional
+            The maximum number of results to yield. Default is None,
+            meaning no limit.
+        index : KeyIndex, optional
+            A key index of the element data. Default is None.
+        as_tuples : bool, optional
+            If True, project columns onto namedtuples. Default is False.
+
+        Returns
+        -------
+        iterator
+            An iterator over the projected results.
+
+        Raises
+        ------
+        ArgumentValidationError
+            If `engine` is not ``"element"`` or ``"raw"``, `limit` is
+            not None or an integer, or `lookup` is a `QueryPlan` and
+            `select` is not empty.
+
+        Notes
+        -----
+        - Pair it with a lazy `Element` so that only the visited part of
+          the data is wrapped.
+        - The lookup and select statement are compiled once into a
+          `QueryPlan`, which is cached for later calls of the same query.
+        - An index is only used for a literal left-hand lookup such as
+          ``hostname`` or ``_text(host.name)``, and only if no indexed key
+          is the literal followed by a newline, which ``$`` also matches.
+          Other lookups traverse the data.
+        - With an index, other lookups skip every big subtree whose key
+          summary has no key matching the left-hand lookup.
+        - With an index, a literal right-hand lookup such as ``status=up``
+          and a ``WHERE key == value`` predicate are answered by the value
+          index of the key.
+        """
+        validate_argument_choice(engine=(engine, ('element', 'raw')))
+        if limit is not None:
+            validate_argument_type(int, limit=limit)
+
+        plan = QueryPlan.resolve(lookup, select, on_exception=self.on_exception)
+        records = self.iter_find_records_(plan.lookup_obj, plan.select_obj,
+                                          engine=engine, index=index)
+        result = self.iter_filter_result(records, plan.select_obj,
+                                         as_tuples=as_tuples)
+        if limit is not None:
+            result = islice(result, limit)
+        return result
+
+    def iter_find_records_(self, lookup_obj, select_obj, engine='element',
+                           index=None):
+        """
+        Lazily yield the records matching a lookup, before projection.
+
+        Parameters
+        ----------
+        lookup_obj : LookupCls
+            The parsed lookup.
+        select_obj : SelectParser
+            The parsed select statement, used to prefilter indexed
+            records.
+        engine : str, optional
+            The traversal engine, ``"element"`` (default) or ``"raw"``.
+        index : KeyIndex, optional
+            A key index of the element data. Default is None.
+
+        Returns
+        -------
+        iterator
+            An iterator over the matched `Element` or `Result` records.
+            An empty lookup with an aggregate select statement, e.g.,
+            ``select count(*)``, yields the rows of `iter_rows_`.
+        """
+        if lookup_obj.left is None and select_obj.is_aggregate_select:
+            return self.iter_rows_()
+
+        literal = lookup_obj.left_literal
+        if index is not None and index.data is not self.data:
+            index = None
+        if index is not None and literal is not None and literal + '\n' not in index:
+            records = self.iter_find_index_(index, lookup_obj)
+        elif engine == 'raw':
+            records = self.iter_find_raw_(self.data, lookup_obj, index=index)
+        else:
+            records = self.iter_find_(self, lookup_obj, index=index)
+        if index is not None:
+            records = self.iter_prefilter_index_(records, index, select_obj)
+        return records
+
+    def iter_rows_(self):
+        """
+        Lazily yield the top-level dictionaries of the data as records.
+
+        Yields
+        ------
+        Result
+            A record whose parent holds the data if it is a dictionary,
+            or each dictionary item of the data if it is a list.
+        """
+        rows = [self.data] if isinstance(self.data, dict) else self.data
+        if not isinstance(rows, (list, tuple)):
+            return
+        for row in rows:
+            if isinstance(row, dict):
+                yield Result(row, parent=Result(row))
+
+    def find_many(self, queries):
+        """
+        Search many lookup expressions in a single traversal.
+
+        Parameters
+        ----------
+        queries : list
+            A list of queries.  Each query is a ``(lookup, select)`` pair,
+            a lookup string when it has no select statement, or a
+            `QueryPlan`.
+
+        Returns
+        -------
+        list of List
+            One `List` per query, in the order of `queries`.  Each `List`
+            is equal to the result of ``find(lookup, select=select)``.
+
+        Raises
+        ------
+        ArgumentValidationError
+            If `queries` is not a list or tuple, or a query is neither a
+            string, a ``(lookup, select)`` pair, nor a `QueryPlan`.
+
+        Notes
+        -----
+        - The data is walked once with `iter_find_many_raw_`, and the
+          matches of every query are then filtered by its own select
+          statement.
+        """
+        validate_argument_type(list, tuple, queries=queries)
+        lookup_objs, select_objs = [], []
+        for query in queries:
+            validate_argument_type(str, list, tuple, QueryPlan, query=query)
+            if isinstance(query, (str, QueryPlan)):
+                lookup, select = query, ''
+            else:
+                lookup, select = query
+            plan = QueryPlan.resolve(lookup, select, on_exception=self.on_exception)
+            lookup_objs.append(plan.lookup_obj)
+            select_objs.append(plan.select_obj)
+
+        records = [[] for _ in lookup_objs]
+        for i, record in self.iter_find_many_raw_(self.data, lookup_objs):
+            records[i].append(record)
+        for i, (lookup_obj, select_obj) in enumerate(zip(lookup_objs, select_objs)):
+            if lookup_obj.left is None and select_obj.is_aggregate_select:
+                records[i] = list(self.iter_rows_())
+
+        result = [
+            List(self.filter_columns_(lst, select_obj))
+            for lst, select_obj in zip(records, select_objs)
+        ]
         return result
 
 
@@ -894,6 +1768,29 @@ class LookupCls:
         The parsed right-hand lookup used to match dictionary values.
         Can be a string, regex pattern, or a callable predicate
         function.
+    left_literal : str or None
+        The exact key matched by the left-hand lookup if its pattern
+        reduces to a literal (e.g., ``abc`` or ``_text(abc)``),
+        otherwise None.
+    right_literal : str or None
+        The exact value matched by the right-hand lookup if its pattern
+        reduces to a literal (e.g., ``=up``), otherwise None.
+    left_pattern : re.Pattern or None
+        The compiled form of `left`, or None if `left` is not a regex
+        pattern string.
+    right_pattern : re.Pattern or None
+        The compiled form of `right`, or None if `right` is not a regex
+        pattern string.
+    left_matcher : callable or None
+        A string-method test equivalent to `left_pattern` if the pattern
+        reduces to an exact, prefix, suffix, or substring match,
+        otherwise None.
+    right_matcher : callable or None
+        The same as `left_matcher` for `right_pattern`.
+    pattern_cache : LRUCache
+        A process-wide cache of compiled patterns shared by all
+        instances.  Call ``LookupCls.pattern_cache.stats()`` to inspect
+        its hits and misses.
 
     Notes
     -----
@@ -932,10 +1829,18 @@ class LookupCls:
     - ``ip_address``, ``ipv4_address``, ``ipv6_address``
     - ``date``, ``datetime``, ``time``
     """
+    pattern_cache = utils.LRUCache(maxsize=1024)
+
     def __init__(self, lookup):
         self.lookup = str(lookup)
         self.left = None
         self.right = None
+        self.left_literal = None
+        self.right_literal = None
+        self.left_pattern = None
+        self.right_pattern = None
+        self.left_matcher = None
+        self.right_matcher = None
         self.process()
 
     @property
@@ -1096,7 +2001,7 @@ class LookupCls:
                 match2_ = re.match(vpat2_, data_, flags=re.VERBOSE)
                 if match2_:
                     op = match2_.group('op')
-                    other = match2_.group('other')
+                    other = OpValidation.to_number(match2_.group('other'))
                     pfunc = partial(
                         OpValidation.compare_number,
                         op=op, other=other, on_exception=False
@@ -1148,6 +2053,145 @@ class LookupCls:
             fmt = 'Failed to parse this lookup : {!r}'
             raise LookupClsError(fmt.format(text))
 
+    @classmethod
+    def compile_pattern(cls, pattern):
+        """
+        Return the compiled regex of a pattern from the shared cache.
+
+        Parameters
+        ----------
+        pattern : str or callable
+            A pattern returned by `parse`.
+
+        Returns
+        -------
+        re.Pattern or None
+            The compiled pattern, or None if `pattern` is not a string
+            or is not a valid regex.  An invalid regex is reported when
+            it is matched, like before it was compiled up front.
+        """
+        if not isinstance(pattern, str):
+            return None
+        try:
+            result = cls.pattern_cache.get_or_set(pattern, re.compile)
+            return result
+        except re.error:
+            return None
+
+    @classmethod
+    def get_text_matcher(cls, pattern, compiled=None):
+        """
+        Build a string-method test for a pattern that needs no regex engine.
+
+        Patterns of the form ``^text$``, ``^text.*$``, ``^.*text$``, and
+        ``^.*text.*$``, e.g., from ``abc``, ``_text(foo.bar)``, or
+        ``_wildcard(Gig*)``, are tested with ``==``, ``str.startswith``,
+        ``str.endswith``, or ``in``.  A ``(?i)`` pattern of ASCII text
+        compares lower-cased ASCII data.
+
+        Parameters
+        ----------
+        pattern : str or callable
+            A pattern returned by `parse`.
+        compiled : re.Pattern, optional
+            The compiled `pattern` if it is already compiled.
+
+        Returns
+        -------
+        callable or None
+            A function taking a string and returning True if the pattern
+            matches it, or None if the pattern needs the regex engine.
+
+        Notes
+        -----
+        - Data with a newline, and non-ASCII data of a ``(?i)`` pattern,
+          are passed to the compiled regex, because ``.`` and ``$``
+          treat newlines specially and case folding is not ASCII-only.
+        """
+        compiled = compiled or cls.compile_pattern(pattern)
+        if compiled is None:
+            return None
+
+        ignore_case = pattern.startswith('(?i)')
+        body = pattern[4:] if ignore_case else pattern
+        is_suffix = body.startswith('^.*')
+        body = '^' + body[3:] if is_suffix else body
+        is_prefix = body.endswith('.*$')
+        literal = cls.get_literal(body[:-3] + '$' if is_prefix else body)
+        if literal is None:
+            return None
+
+        if ignore_case:
+            if not literal.isascii():
+                return None
+            literal = literal.lower()
+
+        if is_suffix and is_prefix:
+            def test(data_):
+                return literal in data_
+        elif is_prefix:
+            def test(data_):
+                return data_.startswith(literal)
+        elif is_suffix:
+            def test(data_):
+                return data_.endswith(literal)
+        else:
+            def test(data_):
+                return data_ == literal
+
+        search = compiled.search
+
+        def matcher(data):
+            if '\n' in data:
+                return bool(search(data))
+            if ignore_case:
+                if not data.isascii():
+                    return bool(search(data))
+                data = data.lower()
+            return test(data)
+        return matcher
+
+    @classmethod
+    def get_literal(cls, pattern):
+        """
+        Reduce an anchored regex pattern to the literal text it matches.
+
+        A pattern produced by `parse` is a literal if it has the form
+        ``^<text>$`` where ``<text>`` only contains ordinary characters
+        or escaped punctuation, e.g., ``^abc$`` or ``^foo\\.bar$``.
+
+        Parameters
+        ----------
+        pattern : str or callable
+            A pattern returned by `parse`.
+
+        Returns
+        -------
+        str or None
+            The literal text if the pattern matches exactly one string
+            (apart from the trailing-newline case of ``$``), otherwise None.
+        """
+        if not isinstance(pattern, str) or not pattern.startswith('^'):
+            return None
+
+        chars = []
+        i, total = 1, len(pattern)
+        while i < total:
+            char = pattern[i]
+            if char == '\\':
+                if i + 1 < total and not pattern[i + 1].isalnum():
+                    chars.append(pattern[i + 1])
+                    i += 2
+                    continue
+                return None
+            if char == '$' and i == total - 1:
+                return ''.join(chars)
+            if char in '.^$*+?{}[]|()':
+                return None
+            chars.append(char)
+            i += 1
+        return None
+
     def process(self):
         """
         Parse the lookup string into left and right expressions.
@@ -1173,8 +2217,16 @@ class LookupCls:
         left = left.strip()
         if left:
             self.left = self.parse(left)
+            self.left_literal = self.get_literal(self.left)
+            self.left_pattern = self.compile_pattern(self.left)
+            self.left_matcher = self.get_text_matcher(self.left,
+                                                      self.left_pattern)
         if lst:
             self.right = self.parse(lst[0])
+            self.right_literal = self.get_literal(self.right)
+            self.right_pattern = self.compile_pattern(self.right)
+            self.right_matcher = self.get_text_matcher(self.right,
+                                                       self.right_pattern)
 
     def is_left_matched(self, data):
         """
@@ -1203,14 +2255,19 @@ class LookupCls:
         Notes
         -----
         - Non-string inputs always return False.
-        - Matching is performed using `re.search` against the parsed left
-          expression if available.
+        - Matching is performed using `left_matcher` or the compiled
+          `left_pattern` if available.
         """
         if not isinstance(data, str):
             return False
 
         if self.left:
-            result = re.search(self.left, data)
+            if self.left_matcher:
+                return self.left_matcher(data)
+            elif self.left_pattern:
+                result = self.left_pattern.search(data)
+            else:
+                result = re.search(self.left, data)
             return bool(result)
         else:
             return True if self.right else False
@@ -1227,7 +2284,7 @@ class LookupCls:
         - If `self.right` is a callable, it is invoked with the input `data`
           and its result is returned.
         - If `self.right` is a regex pattern string, the input must be a string
-          and is tested against the pattern using `re.search`.
+          and is tested against the compiled `right_pattern`.
         - If `data` is not a string when a regex pattern is expected, the method
           returns False.
 
@@ -1259,10 +2316,217 @@ class LookupCls:
             else:
                 if not isinstance(data, str):
                     return False
-                result = re.search(self.right, data)
+                if self.right_matcher:
+                    return self.right_matcher(data)
+                elif self.right_pattern:
+                    result = self.right_pattern.search(data)
+                else:
+                    result = re.search(self.right, data)
                 return bool(result)
 
 
+class MultiLookupCls:
+    """
+    Key matcher that tests a key against many lookups in one call.
+
+    The left-hand lookups of the `LookupCls` instances are merged into
+    a hash table of literal keys plus a residual list of patterns, so a
+    key is looked up once instead of being tested against every lookup
+    in turn.
+
+    Parameters
+    ----------
+    lookup_objs : list of LookupCls
+        The lookups to match.  A lookup is identified by its position
+        in this list.
+
+    Attributes
+    ----------
+    lookup_objs : list of LookupCls
+        The lookups to match.
+
+    Notes
+    -----
+    - A left-hand lookup that reduces to a literal, e.g., ``abc`` or
+      ``_text(a.b)``, goes to the hash table.  Other left-hand lookups,
+      e.g., ``_wildcard(Gig*)``, are tested one by one with their
+      compiled pattern or text matcher.
+    - A lookup without a left-hand part but with a right-hand part
+      matches every key, like `LookupCls.is_left_matched`.
+    - A key containing a newline is tested against every lookup,
+      because ``$`` also matches before a trailing newline.
+    - The matching ids of a key are cached, because the keys of a
+      document repeat a lot.
+    """
+    cache_size = 4096
+
+    def __init__(self, lookup_objs):
+        self.lookup_objs = list(lookup_objs)
+        self._literals = dict()
+        self._residuals = []
+        self._cache = dict()
+
+        for i, lookup_obj in enumerate(self.lookup_objs):
+            literal = lookup_obj.left_literal
+            if literal is not None:
+                self._literals.setdefault(literal, []).append(i)
+            elif lookup_obj.left or lookup_obj.right:
+                self._residuals.append((i, lookup_obj))
+
+    def match(self, key):
+        """
+        Return the ids of the lookups whose left-hand part matches a key.
+
+        Parameters
+        ----------
+        key : Any
+            A dictionary key.  Only string keys can match.
+
+        Returns
+        -------
+        tuple of int
+            The positions of the matching lookups in ascending order.
+        """
+        result = self._cache.get(key) if isinstance(key, str) else ()
+        if result is not None:
+            return result
+
+        if '\n' in key:
+            ids = [i for i, lookup_obj in enumerate(self.lookup_objs)
+                   if lookup_obj.is_left_matched(key)]
+        else:
+            ids = list(self._literals.get(key, []))
+            ids.extend(i for i, lookup_obj in self._residuals
+                       if lookup_obj.is_left_matched(key))
+            ids.sort()
+        result = tuple(ids)
+
+        if len(self._cache) < self.cache_size:
+            self._cache[key] = result
+        return result
+
+
+class QueryPlan:
+    """
+    Compiled form of a query, i.e., a lookup and a select statement.
+
+    A plan holds the parsed lookup matcher, and the parsed select
+    statement with its predicate and projection columns.  Plans are
+    read-only once built, so the plans of frequently used queries are
+    kept in a process-wide LRU cache and shared across calls and
+    threads.
+
+    Parameters
+    ----------
+    lookup : str
+        A lookup expression parsed by `LookupCls`.
+    select : str or SelectParser, optional
+        A select statement parsed by `SelectParser`, or a `SelectParser`
+        whose statement is already parsed. Default is ''.
+    on_exception : bool, optional
+        The `on_exception` flag of the select statement predicate.
+        Default is False.
+
+    Attributes
+    ----------
+    lookup : str
+        The lookup expression.
+    select : str
+        The select statement.
+    on_exception : bool
+        The `on_exception` flag of the select statement predicate.
+    lookup_obj : LookupCls
+        The parsed lookup.
+    select_obj : SelectParser
+        The parsed select statement.
+    plan_cache : LRUCache
+        A process-wide cache of plans shared by all callers.  Call
+        ``QueryPlan.plan_cache.stats()`` to inspect its hits and misses.
+    """
+    plan_cache = utils.LRUCache(maxsize=256)
+
+    def __init__(self, lookup, select='', on_exception=False):
+        self.lookup = str(lookup)
+        self.on_exception = on_exception
+        self.lookup_obj = LookupCls(self.lookup)
+        if isinstance(select, SelectParser):
+            self.select = select.select_statement
+            self.select_obj = select
+        else:
+            self.select = select
+            self.select_obj = SelectParser(select, on_exception=on_exception)
+            self.select_obj.parse_statement()
+
+    @classmethod
+    def get(cls, lookup, select='', on_exception=False, select_obj=None):
+        """
+        Return the plan of a query from the cache, compiling it on a miss.
+
+        Parameters
+        ----------
+        lookup : str
+            A lookup expression parsed by `LookupCls`.
+        select : str, optional
+            A select statement parsed by `SelectParser`. Default is ''.
+        on_exception : bool, optional
+            The `on_exception` flag of the select statement predicate.
+            Default is False.
+        select_obj : SelectParser, optional
+            The already parsed `select` statement, reused on a cache
+            miss instead of parsing `select` again. Default is None.
+
+        Returns
+        -------
+        QueryPlan
+            The compiled plan of the query.
+        """
+        key = (str(lookup), select, bool(on_exception))
+        if select_obj is None:
+            result = cls.plan_cache.get_or_set(key, lambda key_: cls(*key_))
+        else:
+            result = cls.plan_cache.get_or_set(
+                key, lambda key_: cls(key_[0], select_obj, on_exception=key_[2])
+            )
+        return result
+
+    @classmethod
+    def resolve(cls, lookup, select='', on_exception=False):
+        """
+        Return the plan of a query given as text, or already parsed.
+
+        Parameters
+        ----------
+        lookup : str or QueryPlan
+            A lookup expression, or the plan of a whole query.
+        select : str or SelectParser, optional
+            A select statement, or a `SelectParser` whose statement is
+            already parsed.  It must be empty if `lookup` is a plan.
+            Default is ''.
+        on_exception : bool, optional
+            The `on_exception` flag of the select statement predicate.
+            Default is False.
+
+        Returns
+        -------
+        QueryPlan
+            `lookup` if it is a plan, a new plan sharing `select` if it
+            is a `SelectParser`, otherwise the cached plan of the query.
+
+        Raises
+        ------
+        ArgumentValidationError
+            If `lookup` is a plan and `select` is not empty.
+        """
+        if isinstance(lookup, cls):
+            if select != '':
+                msg = 'select must be empty when lookup is a QueryPlan.'
+                raise ArgumentValidationError(msg)
+            return lookup
+        if isinstance(select, SelectParser):
+            return cls(lookup, select, on_exception=on_exception)
+        return cls.get(lookup, select, on_exception=on_exception)
+
+
 class Object:
     """
     Utility class for constructing objects with positional and keyword arguments.
@@ -4,8 +4,9 @@ import operator
 from dictlistlib import utils
 from dictlistlib.argumenthelper import validate_argument_type
 from dictlistlib.collection import Element
-
+from dictlistlib.collection import QueryPlan
 from dictlistlib.parser import SelectParser
+from dictlistlib.index import KeyIndex
 
 
 class DLQuery:
@@ -14,6 +15,13 @@ class DLQuery:
     Attributes
     __________
     data (list, tuple, or dict): list or dictionary instance.
+    cache (bool): keep the built element tree of data between find calls.
+            Default is False.
+    verify (bool): when caching, also compare the number of top-level
+            items of data before reusing the cached tree, and rebuild it
+            if items were added or removed.  It does not look into the
+            items, so call ``invalidate`` after modifying them in place.
+            Default is False.
 
     Properties
     ----------
@@ -26,18 +34,30 @@ class DLQuery:
     values() -> dict_values or odict_values
     items() -> dict_items or odict_items
     get(index, default=None) -> Any
-    find(node=None, lookup='', select='') -> List
+    find(node=None, lookup='', select='', on_exception=False, lazy=False,
+         engine='element', as_tuples=False) -> List
+    iterfind(lookup='', select='', limit=None, node=None, on_exception=False,
+             lazy=True, engine='element', as_tuples=False) -> iterator
+    find_many(queries, node=None, on_exception=False) -> list
+    build_index() -> KeyIndex
+    invalidate() -> None
 
     Raise
     -----
     TypeError: if failed to invoke ``iter`` built-in function.
     """
 
-    def __init__(self, data):
+    def __init__(self, data, cache=False, verify=False):
         validate_argument_type(list, tuple, dict, data=data)
         self.data = data
+        self.cache = cache
+        self.verify = verify
         self._is_dict = None
         self._is_list = None
+        self._elements = dict()
+        self._index = None
+        self._index_fingerprint = None
+        self._version = 0
 
     ############################################################################
     # Special methods
@@ -188,36 +208,276 @@ class DLQuery:
             else:
                 return default
 
-    def find(self, node=None, lookup='', select='', on_exception=False):
+    def find(self, node=None, lookup='', select='', on_exception=False,
+             lazy=False, engine='element', as_tuples=False):
         """recursively search a lookup.
 
         Parameters
         ----------
         node (dict, list): a dict, dict-like, list, or list-like instance.
-        lookup (str): a search pattern.
-        select (str): a select statement.
+        lookup (str, QueryPlan): a search pattern, or a query plan
+                that carries both lookup and select statement.
+        select (str, SelectParser): a select statement, or an
+                already parsed select statement.
         on_exception (bool): raise `Exception` if set True, otherwise, return False.
+        lazy (bool): only wrap the part of the data that the search visits
+                instead of building the whole element tree up front.
+                Default is False.
+        engine (str): a traversal engine.  "element" walks a tree of
+                `Element` instances, "raw" walks the dict/list data
+                directly without wrapping it.  Default is "element".
+        as_tuples (bool): return selected columns as namedtuples instead
+                of dictionaries.  Default is False.
 
         Returns
         -------
         List: list of Any.
         """
         node = node or self.data
-        lookup = str(lookup).strip()
-        if lookup == '':
+        plan = self._get_plan(lookup, select, on_exception=on_exception)
+        if plan is None:
+            return node
+
+        validate_argument_type(list, tuple, dict, node=node)
+
+        index = self._get_index(node)
+        elm_obj = self._get_element(node, on_exception=on_exception,
+                                    lazy=lazy or index is not None,
+                                    engine=engine)
+        records = elm_obj.find(plan, engine=engine, index=index,
+                               as_tuples=as_tuples)
+        return records
+
+    def iterfind(self, lookup='', select='', limit=None, node=None,
+                 on_exception=False, lazy=True, engine='element',
+                 as_tuples=False):
+        """lazily search a lookup and yield results as they are found.
 
-            if select == '' or re.match(r'(?i)select +([*]|_+all_+) *$', select):
-                return node
+        The results and their order are the same as ``find``, but the
+        traversal stops as soon as ``limit`` results are produced, so
+        checking whether any match exists does not scan the whole data.
+
+        Parameters
+        ----------
+        lookup (str, QueryPlan): a search pattern, or a query plan.
+        select (str, SelectParser): a select statement, or an
+                already parsed select statement.
+        limit (int): a maximum number of results.  Default is None.
+        node (dict, list): a dict, dict-like, list, or list-like instance.
+        on_exception (bool): raise `Exception` if set True, otherwise, return False.
+        lazy (bool): only wrap the part of the data that the search visits.
+                Default is True.
+        engine (str): a traversal engine, "element" or "raw".
+                Default is "element".
+        as_tuples (bool): return selected columns as namedtuples instead
+                of dictionaries.  Default is False.
 
-            parsed_obj = SelectParser(select, on_exception=on_exception)
-            parsed_obj.parse_statement()
-            if parsed_obj.columns and parsed_obj.columns != [None]:
-                lookup = parsed_obj.columns[0]
-            elif parsed_obj.left_operands:
-                lookup = parsed_obj.left_operands[0]
+        Returns
+        -------
+        iterator: an iterator of Any.  If lookup and select are both
+                empty, the node itself is the only item.
+        """
+        node = node or self.data
+        plan = self._get_plan(lookup, select, on_exception=on_exception)
+        if plan is None:
+            return iter([node])
 
         validate_argument_type(list, tuple, dict, node=node)
 
-        elm_obj = Element(node, on_exception=on_exception)
-        records = elm_obj.find(lookup, select=select)
-        return records
+        index = self._get_index(node)
+        elm_obj = self._get_element(node, on_exception=on_exception,
+                                    lazy=lazy or index is not None,
+                                    engine=engine)
+        result = elm_obj.iterfind(plan, engine=engine, limit=limit,
+                                  index=index, as_tuples=as_tuples)
+        return result
+
+    def find_many(self, queries, node=None, on_exception=False):
+        """search many lookups in a single traversal of node.
+
+        Parameters
+        ----------
+        queries (list): a list of queries.  Each query is a
+                ``(lookup, select)`` pair, a lookup string, or a
+                query plan.
+        node (dict, list): a dict, dict-like, list, or list-like instance.
+        on_exception (bool): raise `Exception` if set True, otherwise, return False.
+
+        Returns
+        -------
+        list: one result per query, in order, equal to the result of
+                ``find(node=node, lookup=lookup, select=select)``.
+        """
+        validate_argument_type(list, tuple, queries=queries)
+        node = node or self.data
+        validate_argument_type(list, tuple, dict, node=node)
+
+        plans = []
+        for query in queries:
+            validate_argument_type(str, list, tuple, QueryPlan, query=query)
+            if isinstance(query, (str, QueryPlan)):
+                lookup, select = query, ''
+            else:
+                lookup, select = query
+            plans.append(self._get_plan(lookup, select, on_exception=on_exception))
+
+        elm_obj = Element(node, on_exception=on_exception, lazy=True)
+        records = elm_obj.find_many([plan for plan in plans if plan is not None])
+        records = iter(records)
+        result = [node if plan is None else next(records) for plan in plans]
+        return result
+
+    def build_index(self):
+        """build an inverted index of the dictionary keys of data.
+
+        Once built, a search of data whose lookup has a literal key,
+        e.g., ``hostname`` or ``hostname=_iregex(^sw)``, reads the
+        locations of the key from the index instead of visiting every
+        node.  The string values of a key are indexed on the first
+        equality query of the key, e.g., ``status=up`` or
+        ``where status == up``.  The index is rebuilt on the next search
+        after ``invalidate`` is called, data is reassigned, or (with
+        verify) the number of top-level items of data changes, so call
+        ``invalidate`` after modifying data in place.
+
+        Returns
+        -------
+        KeyIndex: an index of dictionary keys of data.
+        """
+        self._index = KeyIndex(self.data)
+        self._index_fingerprint = self._get_fingerprint()
+        return self._index
+
+    def invalidate(self):
+        """discard the cached element tree of data and mark the key index
+        of data for rebuild.
+
+        Call it after modifying data in place when the DLQuery instance
+        caches its element tree or has an index.
+        """
+        self._version += 1
+        self._elements.clear()
+
+    ############################################################################
+    # private methods
+    ############################################################################
+    def _get_fingerprint(self):
+        """return a cheap fingerprint of data to detect a change.
+
+        The fingerprint changes when ``invalidate`` is called, and with
+        verify, when the number of top-level items of data changes.  It
+        never walks data, so it costs the same for any size of data.
+        """
+        size = len(self.data) if self.verify else None
+        return self._version, size
+
+    def _get_index(self, node):
+        """return the key index if it is usable for searching node.
+
+        A key index that was built before data was reassigned or changed,
+        see ``_get_fingerprint``, is rebuilt first.
+
+        Parameters
+        ----------
+        node (dict, list): a dict, dict-like, list, or list-like instance.
+
+        Returns
+        -------
+        KeyIndex or None: the key index of data if it was built and
+                node is data.
+        """
+        index = self._index
+        if index is None or node is not self.data:
+            return None
+        if index.data is not node or self._index_fingerprint != self._get_fingerprint():
+            index = self.build_index()
+        return index
+
+    def _get_element(self, node, on_exception=False, lazy=False,
+                     engine='element'):
+        """return an Element of node for searching.
+
+        If caching is enabled and node is data, the element tree built by
+        a previous search is reused until ``invalidate`` is called, data
+        is reassigned, or (with verify) the number of top-level items of
+        data changes.
+
+        Parameters
+        ----------
+        node (dict, list): a dict, dict-like, list, or list-like instance.
+        on_exception (bool): raise `Exception` if set True, otherwise, return False.
+        lazy (bool): only wrap the part of the data that the search visits.
+        engine (str): a traversal engine, "element" or "raw".
+
+        Returns
+        -------
+        Element: an element of node.
+        """
+        if engine == 'raw':
+            # the raw engine does not walk child elements
+            return Element(node, on_exception=on_exception, lazy=True)
+
+        if not self.cache or node is not self.data:
+            return Element(node, on_exception=on_exception, lazy=lazy)
+
+        fingerprint = self._get_fingerprint()
+        key = bool(on_exception)
+        if key in self._elements:
+            data, cached_fingerprint, elm_obj = self._elements[key]
+            if data is self.data and cached_fingerprint == fingerprint:
+                return elm_obj
+
+        elm_obj = Element(node, on_exception=on_exception, lazy=lazy)
+        self._elements[key] = (self.data, fingerprint, elm_obj)
+        return elm_obj
+
+    def _get_plan(self, lookup, select, on_exception=False):     # noqa
+        """derive the plan of a search.
+
+        If lookup is empty, the first selected column that is not an
+        aggregate, the first GROUP BY column, the first aggregated
+        column, the first operand of the WHERE clause, or the first
+        ORDER BY column is used as lookup.  Without any of them, e.g.,
+        ``select count(*)``, the lookup stays empty and the aggregate is
+        computed over the dictionaries of node.  The select statement is
+        parsed once and shared by the plan.
+
+        Parameters
+        ----------
+        lookup (str, QueryPlan): a search pattern, or a query plan.
+        select (str, SelectParser): a select statement, or a parsed one.
+        on_exception (bool): raise `Exception` if set True, otherwise, return False.
+
+        Returns
+        -------
+        QueryPlan or None: a plan, or None if both lookup and select
+                are empty, i.e., the whole node is the result.
+        """
+        if isinstance(lookup, QueryPlan) or str(lookup).strip() != '':
+            lookup = lookup if isinstance(lookup, QueryPlan) else str(lookup).strip()
+            return QueryPlan.resolve(lookup, select, on_exception=on_exception)
+
+        is_parsed = isinstance(select, SelectParser)
+        statement = select.select_statement if is_parsed else select
+        pattern = r'(?i)select +(distinct +)?([*]|_+all_+) *$'
+        if statement == '' or re.match(pattern, statement):
+            return None
+
+        if is_parsed:
+            select_obj = select
+        else:
+            select_obj = QueryPlan.get('', select, on_exception=on_exception).select_obj
+
+        aggregated = dict((column, arg) for column, _, arg in select_obj.aggregates)
+        columns = [column for column in select_obj.columns
+                   if column is not None and column not in aggregated]
+        candidates = columns + select_obj.group_by
+        candidates += [arg for arg in aggregated.values() if arg != '*']
+        candidates += select_obj.left_operands
+        candidates += [column for column, _ in select_obj.order_by]
+        lookup = candidates[0] if candidates else ''
+
+        if is_parsed:
+            return QueryPlan(lookup, select_obj, on_exception=on_exception)
+        return QueryPlan.get(lookup, select, on_exception=on_exception,
+                             select_obj=select_obj)
@@ -26,6 +26,10 @@ class LookupClsError(Exception):
     """Raised when an error occurs in a `LookupObject` instance."""
 
 
+class SelectParserError(Exception):
+    """Raised when a select statement fails to parse."""
+
+
 class ObjectArgumentError(Exception):
     """Raised when invalid arguments are passed to an `Object` class."""
 
@@ -0,0 +1,297 @@
+"""
+Module providing index structures for querying dictionary or list data.
+
+This module defines `KeyIndex`, an inverted index that maps every
+dictionary key found in nested dict/list data to the locations where
+the key occurs.  It lets a lookup on an exact key be answered from the
+index instead of walking the whole data.
+"""
+
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+
+from dictlistlib.validation import OpValidation
+
+# data types whose items are visited while indexing
+_CONTAINERS = (dict, list, tuple, set)
+
+
+class KeyIndex:
+    """
+    An inverted index of the dictionary keys of nested dict/list data.
+
+    The index is built in a single depth-first pass over the data, in
+    the same order as the lookup traversals of `Element`, so the
+    locations of a key are listed in the order a search finds them.
+
+    Parameters
+    ----------
+    data : dict, list, or tuple
+        The data to index.
+    summary_size : int, optional
+        The minimum number of items, counted over the whole subtree, of
+        a dict or list whose key summary is kept. Default is 64.
+
+    Attributes
+    ----------
+    data : dict, list, or tuple
+        The indexed data.  The index is a snapshot of the data and must
+        be rebuilt after the data is modified in place.
+    summary_size : int
+        The minimum subtree size of a key summary.
+
+    Notes
+    -----
+    - Only string keys are indexed, because lookups only match string
+      keys.
+    - Each location is a ``(parent, value)`` tuple, where ``parent`` is
+      the dictionary holding the key and ``value`` is the value of the
+      key.
+    - The string values of a key are indexed lazily by `get_values`,
+      the first time the key is queried with an equality.
+    - The numeric values of a key are sorted lazily by `compare_number`,
+      the first time the key is queried with a numeric comparison.
+    - A key summary is the set of string keys found anywhere below a
+      big dict or list.  A traversal can skip the subtree when none of
+      the keys in its summary match the lookup.
+    """
+
+    def __init__(self, data, summary_size=64):
+        self.data = data
+        self.summary_size = summary_size
+        self._keys = dict()
+        self._values = dict()
+        self._numbers = dict()
+        self._summaries = dict()
+        self.build()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def build(self):
+        """
+        Walk the data and record the locations of every dictionary key.
+
+        The same walk collects the key summary of every dict or list
+        whose subtree holds at least `summary_size` items.  The walk
+        uses an explicit stack of iterators, so deeply nested data does
+        not hit the interpreter recursion limit.
+        """
+        keys = self._keys
+        keys.clear()
+        self._values.clear()
+        self._numbers.clear()
+        self._summaries.clear()
+        if not isinstance(self.data, _CONTAINERS):
+            return
+
+        def new_frame(data_):
+            # frame: [data, iterator, is_dict, subtree keys, subtree size]
+            if isinstance(data_, dict):
+                return [data_, iter(data_.items()), True, set(), 0]
+            return [data_, iter(data_), False, set(), 0]
+
+        stack = [new_frame(self.data)]
+        while stack:
+            frame = stack[-1]
+            parent, entries, is_dict, subtree_keys = frame[:4]
+            for entry in entries:
+                frame[4] += 1
+                if is_dict:
+                    key, val = entry
+                    if isinstance(key, str):
+                        subtree_keys.add(key)
+                        locations = keys.get(key)
+                        if locations is None:
+                            keys[key] = locations = []
+                        locations.append((parent, val))
+                else:
+                    val = entry
+                if isinstance(val, _CONTAINERS) and val:
+                    stack.append(new_frame(val))
+                    break
+            else:
+                stack.pop()
+                if frame[4] >= self.summary_size:
+                    self._summaries[id(parent)] = frozenset(subtree_keys)
+                if stack:
+                    stack[-1][3].update(subtree_keys)
+                    stack[-1][4] += frame[4]
+
+    def keys(self):
+        """
+        Return a view of the indexed dictionary keys.
+
+        Returns
+        -------
+        dict_keys
+            The distinct string keys found in the data.
+        """
+        return self._keys.keys()
+
+    def get(self, key):
+        """
+        Return the locations of a dictionary key.
+
+        Parameters
+        ----------
+        key : str
+            The exact dictionary key.
+
+        Returns
+        -------
+        list of tuple
+            A list of ``(parent, value)`` tuples in traversal order, or
+            an empty list if the key is not found.
+        """
+        return self._keys.get(key, [])
+
+    def get_summary(self, data):
+        """
+        Return the key summary of a dict or list of the indexed data.
+
+        Parameters
+        ----------
+        data : dict, list, or tuple
+            A container within the indexed data.
+
+        Returns
+        -------
+        frozenset or None
+            The string keys found anywhere in the subtree of `data`, or
+            None if the subtree is smaller than `summary_size`.
+        """
+        return self._summaries.get(id(data))
+
+    def get_values(self, key):
+        """
+        Return the locations of a dictionary key grouped by string value.
+
+        The value index of a key is built on the first call for the key
+        and reused afterwards.  Values that are not strings are left out,
+        because equality lookups only match string values.
+
+        Parameters
+        ----------
+        key : str
+            The exact dictionary key.
+
+        Returns
+        -------
+        dict
+            A mapping of each string value of the key to a list of
+            ``(parent, value)`` tuples in traversal order.
+        """
+        values = self._values.get(key)
+        if values is None:
+            values = dict()
+            for location in self.get(key):
+                val = location[1]
+                if isinstance(val, str):
+                    locations = values.get(val)
+                    if locations is None:
+                        values[val] = locations = []
+                    locations.append(location)
+            self._values[key] = values
+        return values
+
+    def get_numbers(self, key):
+        """
+        Return the numeric values of a dictionary key in sorted order.
+
+        The values are converted by `OpValidation.to_number`, the same
+        conversion `OpValidation.compare_number` applies, and values that
+        cannot be converted are left out.  The sorted values of a key are
+        built on the first call for the key and reused afterwards.
+
+        Parameters
+        ----------
+        key : str
+            The exact dictionary key.
+
+        Returns
+        -------
+        tuple
+            A ``(numbers, positions, nan_positions)`` tuple, where
+            ``numbers`` is an ``array('d')`` of the sorted values,
+            ``positions`` is an ``array('q')`` of the matching positions
+            in `get` order, and ``nan_positions`` lists the positions of
+            NaN values, which cannot be sorted.
+        """
+        result = self._numbers.get(key)
+        if result is None:
+            pairs, nan_positions = [], []
+            for position, (_, val) in enumerate(self.get(key)):
+                try:
+                    num = OpValidation.to_number(val)
+                except Exception:   # noqa
+                    continue
+                if num != num:
+                    nan_positions.append(position)
+                else:
+                    pairs.append((num, position))
+            pairs.sort()
+            numbers = array('d', [num for num, _ in pairs])
+            positions = array('q', [position for _, position in pairs])
+            result = self._numbers[key] = (numbers, positions, nan_positions)
+        return result
+
+    def compare_number(self, key, op, other):
+        """
+        Return the locations of a key whose value satisfies a comparison.
+
+        The comparison is answered by binary search over the sorted
+        values of the key, and it agrees with applying
+        `OpValidation.compare_number` to every location of the key.
+
+        Parameters
+        ----------
+        key : str
+            The exact dictionary key.
+        op : str
+            The comparison operator, i.e., ``lt``, ``le``, ``gt``,
+            ``ge``, ``eq``, or ``ne``.
+        other : Any
+            The number to compare against, e.g., ``1500`` or ``"1500"``.
+
+        Returns
+        -------
+        list of tuple
+            A list of ``(parent, value)`` tuples in traversal order.
+
+        Raises
+        ------
+        ValueError
+            If `op` is not supported, or `other` is not numeric.
+        """
+        num = OpValidation.to_number(other)
+        numbers, positions, nan_positions = self.get_numbers(key)
+
+        if num != num:
+            # NaN is only unequal to any number
+            selected = list(positions) + nan_positions if op == 'ne' else []
+        elif op == 'lt':
+            selected = positions[:bisect_left(numbers, num)]
+        elif op == 'le':
+            selected = positions[:bisect_right(numbers, num)]
+        elif op == 'gt':
+            selected = positions[bisect_right(numbers, num):]
+        elif op == 'ge':
+            selected = positions[bisect_left(numbers, num):]
+        elif op == 'eq':
+            selected = positions[bisect_left(numbers, num):bisect_right(numbers, num)]
+        elif op == 'ne':
+            selected = list(positions[:bisect_left(numbers, num)])
+            selected.extend(positions[bisect_right(numbers, num):])
+            selected.extend(nan_positions)
+        else:
+            fmt = 'Invalid {!r} operator for comparing number.'
+            raise ValueError(fmt.format(op))
+
+        locations = self.get(key)
+        result = [locations[position] for position in sorted(selected)]
+        return result
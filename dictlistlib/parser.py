@@ -16,13 +16,43 @@ SelectParser
 
 import re
 import logging
+import operator
+from array import array
+from collections import namedtuple
 from functools import partial
+from dictlistlib import utils
 from dictlistlib.predicate import Predicate
+from dictlistlib.validation import OpValidation
+from dictlistlib.validation import VersionValidation
+from dictlistlib.validation import DatetimeValidation
+from dictlistlib.validation import CustomValidation
+from dictlistlib.exceptions import SelectParserError
 
 
 logger = logging.getLogger(__file__)
 
 
+class DescendingKey:
+    """
+    Sort key wrapper that reverses the order of the wrapped key.
+
+    Parameters
+    ----------
+    key : Any
+        A sort key supporting ``<`` and ``==``.
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+
 class SelectParser:
     """
     Parser for SQL-like SELECT statements.
@@ -39,6 +69,25 @@ class SelectParser:
         List of column names referenced in the statement.
     predicate : callable
         A function used to evaluate filtering conditions.
+    expressions_tree : tuple or None
+        The parsed and reordered WHERE clause, see `parse_expressions`
+        and `optimize_expressions`.
+    predicate_costs : dict
+        The static cost class of each `Predicate` method, used to
+        evaluate cheap expressions first.
+    is_distinct : bool
+        True if the statement is a ``SELECT DISTINCT``.
+    aggregates : list of tuple
+        The aggregate columns, e.g., ``count(*)`` or ``sum(errors)``, as
+        ``(column, function, argument)`` tuples.
+    group_by : list of str
+        The ``GROUP BY`` columns.
+    order_by : list of tuple
+        The ``ORDER BY`` columns as ``(column, is_descending)`` tuples.
+    limit : int or None
+        The ``LIMIT`` of the results, or None if unlimited.
+    offset : int
+        The number of leading results skipped by ``OFFSET``.
     logger : logging.Logger
         Logger instance for reporting parsing activity and errors.
     on_exception : bool
@@ -50,20 +99,62 @@ class SelectParser:
         Indicates whether the SELECT statement returns zero columns.
     is_all_select() -> bool
         Indicates whether the SELECT statement requests all columns.
+    get_projection(as_tuples=False) -> callable
+        Return a function that projects a record onto the selected columns.
+    get_distinct_key() -> callable
+        Return a function that computes the DISTINCT key of a record.
     get_predicate(expression) -> callable
         Build and return a predicate function from the given expression.
+    tokenize_expressions(expressions) -> list
+        Split a WHERE clause into tokens.
+    parse_expressions(tokens) -> tuple
+        Build an expression tree with precedence and parentheses.
+    optimize_expressions(tree, is_conjunct=True) -> tuple
+        Reorder ``and``/``or`` operands by static evaluation cost.
+    evaluate_columns(rows, on_exception=False) -> list
+        Evaluate the WHERE clause over many records, column by column.
+    explain() -> str
+        Describe the WHERE clause evaluation plan.
+    compile_predicate(tree) -> callable
+        Compile an expression tree into a single predicate function.
     build_predicate() -> callable
         Construct the predicate function based on the parsed statement.
+    parse_trailing_clauses(text, is_where=False) -> str
+        Parse the trailing GROUP BY, ORDER BY, and LIMIT clauses.
+    aggregate(rows) -> list
+        Compute the aggregate columns of each GROUP BY group.
+    get_order_key() -> callable
+        Return a function that computes the sort key of a record.
     parse_statement() -> None
         Parse the SELECT statement and populate attributes accordingly.
     """
+    # static cost class of each predicate, from a dictionary lookup with
+    # a string comparison up to a fuzzy datetime parse
+    predicate_costs = {
+        'true': 0, 'false': 0,
+        'compare': 1, 'contain': 1, 'notcontain': 1,
+        'belong': 1, 'notbelong': 1,
+        'compare_number': 2,
+        'match': 3, 'notmatch': 3, 'is_': 3, 'isnot': 3,
+        'compare_version': 4, 'compare_semantic_version': 4,
+        'compare_datetime': 5,
+    }
+
     def __init__(self, select_statement, on_exception=True):
         self.select_statement = select_statement
         self.columns = [None]
         self.left_operands = []
         self.predicate = None
+        self.expressions_tree = None
         self.logger = logger
         self.on_exception = on_exception
+        self.is_distinct = False
+        self.aggregates = []
+        self.group_by = []
+        self.order_by = []
+        self.limit = None
+        self.offset = 0
+        self._projections = dict()
 
     @property
     def is_zero_select(self):
@@ -81,6 +172,19 @@ class SelectParser:
         """
         return self.columns == [None]
 
+    @property
+    def is_aggregate_select(self):
+        """
+        Check whether the SELECT statement groups or aggregates records.
+
+        Returns
+        -------
+        bool
+            True if the statement has a ``GROUP BY`` clause or an
+            aggregate column, otherwise False.
+        """
+        return bool(self.group_by or self.aggregates)
+
     @property
     def is_all_select(self):
         """
@@ -97,6 +201,116 @@ class SelectParser:
         """
         return self.columns == []
 
+    def get_projection(self, as_tuples=False):
+        """
+        Return a function that projects a record onto the selected columns.
+
+        The function is compiled on the first call and reused afterwards.
+        A plain dict is projected with an `operator.itemgetter` of the
+        column tuple, and a dict subclass with its own ``fromkeys``, so
+        the projection keeps the record type.
+
+        Parameters
+        ----------
+        as_tuples : bool, optional
+            If True, project onto a namedtuple with one field per column,
+            renamed when a column is not a valid field name, instead of
+            a dictionary.  Default is False.
+
+        Returns
+        -------
+        callable
+            A function ``projection(data)`` that returns the projected
+            record, or None if `data` is missing any selected column.
+        """
+        as_tuples = bool(as_tuples)
+        projection = self._projections.get(as_tuples)
+        if projection is not None:
+            return projection
+
+        columns = tuple(self.columns)
+        getter = operator.itemgetter(*columns)
+        is_single = len(columns) == 1
+        make_row = None
+        if as_tuples:
+            row_type = namedtuple('Row', columns, rename=True)
+            make_row = partial(tuple.__new__, row_type)
+
+        def projection(data):
+            if type(data) is dict:
+                try:
+                    values = getter(data)
+                except KeyError:
+                    return None
+                values = (values,) if is_single else values
+                return make_row(values) if as_tuples else dict(zip(columns, values))
+
+            if not all(key in data for key in columns):
+                return None
+            if as_tuples:
+                return make_row(data.get(key, None) for key in columns)
+            new_data = data.fromkeys(columns)
+            for key in new_data:
+                new_data[key] = data.get(key, None)
+            return new_data
+
+        self._projections[as_tuples] = projection
+        return projection
+
+    def get_distinct_key(self):
+        """
+        Return a function that computes the ``DISTINCT`` key of a record.
+
+        Returns
+        -------
+        callable
+            A function ``key(data, parent)`` of a record value and its
+            parent dictionary.  It returns the identity of `parent` for
+            ``SELECT DISTINCT *``, a hashable form of `data` for a
+            statement without columns, otherwise a hashable form of the
+            projected columns, or None if `parent` is missing a column.
+        """
+        if self.is_all_select:
+            return lambda data, parent: id(parent)
+        if self.is_zero_select:
+            return lambda data, parent: utils.freeze(data)
+
+        projection = self.get_projection()
+
+        def key(data, parent):     # noqa
+            new_data = projection(parent)
+            return None if new_data is None else utils.freeze(tuple(new_data.values()))
+        return key
+
+    def prepare_operand(self, func, value, *args):     # noqa
+        """
+        Convert the right-hand operand of an expression once per query.
+
+        The converted operand, e.g., a float, a parsed datetime, or a
+        parsed version, is stored in the predicate, so only the record
+        value is converted when the predicate runs.
+
+        Parameters
+        ----------
+        func : callable
+            A conversion function, e.g., `OpValidation.to_number`.
+        value : str
+            The operand text.
+        *args : Any
+            Extra arguments of `func`.
+
+        Returns
+        -------
+        Any
+            The converted operand, or `value` if the conversion fails, so
+            that the failure is reported when the predicate runs.
+        """
+        try:
+            result = func(value, *args)
+            return result
+        except Exception as ex:     # noqa
+            return value
+
     def get_predicate(self, expression):
         """
         Build a predicate function from an expression.
@@ -170,21 +384,29 @@ class SelectParser:
                 semantic = match_version.group('semantic')
                 expected_version = match_version.group('expected_version')
                 if not semantic:
+                    other = self.prepare_operand(VersionValidation.parse_version,
+                                                 expected_version)
                     func = partial(Predicate.compare_version, key=key,
-                                   op=op, other=expected_version,
+                                   op=op, other=other,
                                    on_exception=self.on_exception)
                 else:
+                    other = self.prepare_operand(VersionValidation.parse_version,
+                                                 expected_version, 'semver')
                     func = partial(Predicate.compare_semantic_version,
-                                   key=key, op=op, other=expected_version,
+                                   key=key, op=op, other=other,
                                    on_exception=self.on_exception)
             elif match_datetime:
                 datetime_str = match_datetime.group('datetime_str')
+                other = self.prepare_operand(DatetimeValidation.parse_operand,
+                                             datetime_str)
                 func = partial(Predicate.compare_datetime, key=key,
-                               op=op, other=datetime_str,
+                               op=op, other=other,
                                on_exception=self.on_exception)
             else:
+                other = self.prepare_operand(OpValidation.to_number, value)
                 func = partial(Predicate.compare_number, key=key,
-                               op=op, other=value)
+                               op=op, other=other,
+                               on_exception=self.on_exception)
         elif op in tbl2:
             op = tbl2.get(op)
             val = str(value).strip()
@@ -201,23 +423,30 @@ class SelectParser:
                 semantic = match_version.group('semantic')
                 expected_version = match_version.group('expected_version')
                 if not semantic:
+                    other = self.prepare_operand(VersionValidation.parse_version,
+                                                 expected_version)
                     func = partial(Predicate.compare_version, key=key,
-                                   op=op, other=expected_version,
+                                   op=op, other=other,
                                    on_exception=self.on_exception)
                 else:
+                    other = self.prepare_operand(VersionValidation.parse_version,
+                                                 expected_version, 'semver')
                     func = partial(Predicate.compare_semantic_version,
-                                   key=key, op=op, other=expected_version,
+                                   key=key, op=op, other=other,
                                    on_exception=self.on_exception)
             elif match_datetime:
                 datetime_str = match_datetime.group('datetime_str')
+                other = self.prepare_operand(DatetimeValidation.parse_operand,
+                                             datetime_str)
                 func = partial(Predicate.compare_datetime, key=key,
-                               op=op, other=datetime_str,
+                               op=op, other=other,
                                on_exception=self.on_exception)
             else:
                 try:
                     float(value)
+                    other = self.prepare_operand(OpValidation.to_number, value)
                     func = partial(Predicate.compare_number,
-                                   key=key, op=op, other=value,
+                                   key=key, op=op, other=other,
                                    on_exception=self.on_exception)
                 except Exception as ex:     # noqa
                     func = partial(Predicate.compare,
@@ -250,6 +479,414 @@ class SelectParser:
             func = partial(Predicate.false)
         return func
 
+    def tokenize_expressions(self, expressions):     # noqa
+        """
+        Split a WHERE clause into expression, operator, and parenthesis tokens.
+
+        The clause is split on the logical operators ``and_``, ``&&``,
+        ``or_``, and ``||``.  Grouping parentheses are the ones leading
+        an expression, and the unbalanced ones trailing it, so the
+        parentheses of a value such as ``version(1.2)`` are kept.
+
+        Parameters
+        ----------
+        expressions : str
+            The WHERE clause, e.g., ``"(a gt 1 or_ b eq 2) and_ c eq 3"``.
+
+        Returns
+        -------
+        list of tuple
+            Tokens of the form ``('expr', text)``, ``('op', 'and')``,
+            ``('op', 'or')``, ``('(',)``, or ``(')',)``.  If the grouping
+            parentheses are not balanced, no parenthesis token is made
+            and each expression is kept as written.
+        """
+        segments, ops = [], []
+        start = 0
+        for match in re.finditer(' +(or_|and_|&&|[|]{2}) +', expressions, flags=re.I):
+            segments.append(expressions[start:match.start()].strip())
+            op = match.group().strip().lower()
+            ops.append('or' if op in ('or_', '||') else 'and')
+            start = match.end()
+        segments.append(expressions[start:].strip())
+
+        tokens, plain_tokens = [], []
+        depth, min_depth = 0, 0
+        for i, segment in enumerate(segments):
+            if i:
+                tokens.append(('op', ops[i - 1]))
+                plain_tokens.append(('op', ops[i - 1]))
+            plain_tokens.append(('expr', segment))
+
+            lead = re.match(r'[(\s]*', segment).group()
+            opens = lead.count('(')
+            expr = segment[len(lead):]
+            closes = 0
+            while expr.endswith(')') and expr.count(')') > expr.count('('):
+                expr = expr[:-1].rstrip()
+                closes += 1
+
+            depth += opens
+            tokens.extend([('(',)] * opens)
+            tokens.append(('expr', expr))
+            tokens.extend([(')',)] * closes)
+            depth -= closes
+            min_depth = min(min_depth, depth)
+        return tokens if depth == min_depth == 0 else plain_tokens
+
+    def parse_expressions(self, tokens):
+        """
+        Build an expression tree from WHERE clause tokens.
+
+        ``and`` binds tighter than ``or``, and parentheses group
+        expressions, e.g., ``a or b and c`` is ``a or (b and c)``.
+
+        Parameters
+        ----------
+        tokens : list of tuple
+            Tokens returned by `tokenize_expressions`.
+
+        Returns
+        -------
+        tuple
+            The root node.  A node is ``('or', [nodes])``,
+            ``('and', [nodes])``, or ``('expr', func, text)`` where
+            ``func`` is the predicate of the expression ``text``.
+
+        Raises
+        ------
+        ValueError
+            If the tokens do not form a valid clause.
+        """
+        pos = 0
+
+        def peek():
+            return tokens[pos] if pos < len(tokens) else (None,)
+
+        def parse_group(op):
+            nonlocal pos
+            parse_operand = parse_atom if op == 'and' else partial(parse_group, 'and')
+            nodes = [parse_operand()]
+            while peek() == ('op', op):
+                pos += 1
+                nodes.append(parse_operand())
+            return nodes[0] if len(nodes) == 1 else (op, nodes)
+
+        def parse_atom():
+            nonlocal pos
+            token = peek()
+            pos += 1
+            if token[0] == '(':
+                node = parse_group('or')
+                if peek() != (')',):
+                    raise ValueError('missing closing parenthesis')
+                pos += 1
+                return node
+            elif token[0] == 'expr':
+                return 'expr', self.get_predicate(token[1]), token[1]
+            raise ValueError('unexpected {!r} token'.format(token))
+
+        tree = parse_group('or')
+        if pos != len(tokens):
+            raise ValueError('unexpected {!r} token'.format(tokens[pos]))
+        return tree
+
+    def get_cost(self, node):
+        """
+        Return the static evaluation cost of an expression tree node.
+
+        Parameters
+        ----------
+        node : tuple
+            A node returned by `parse_expressions`.
+
+        Returns
+        -------
+        int
+            The cost class of the predicate of an expression, see
+            `predicate_costs`, or the total cost of the expressions of
+            an ``and``/``or`` group.
+        """
+        if node[0] != 'expr':
+            return sum(self.get_cost(child) for child in node[1])
+        func = getattr(node[1], 'func', node[1])
+        name = getattr(func, '__name__', '')
+        return self.predicate_costs.get(name, max(self.predicate_costs.values()))
+
+    def is_safe_expression(self, node):     # noqa
+        """
+        Check whether an expression tree node never raises an exception.
+
+        Parameters
+        ----------
+        node : tuple
+            A node returned by `parse_expressions`.
+
+        Returns
+        -------
+        bool
+            True if every predicate in the node returns False instead
+            of raising an exception, otherwise False.
+        """
+        if node[0] != 'expr':
+            return all(self.is_safe_expression(child) for child in node[1])
+        func = node[1]
+        if not isinstance(func, partial):
+            return False
+        if func.func in (Predicate.true, Predicate.false):
+            return True
+        if func.func in (Predicate.is_, Predicate.isnot):
+            # an unknown custom keyword raises NotImplementedError
+            name = 'is_{}'.format(str(func.keywords.get('custom')).lower())
+            if not callable(getattr(CustomValidation, name, None)):
+                return False
+        return func.keywords.get('on_exception', True) is False
+
+    def optimize_expressions(self, tree, is_conjunct=True):
+        """
+        Reorder the operands of ``and``/``or`` groups by evaluation cost.
+
+        Cheap predicates, e.g., string equality, are moved ahead of
+        expensive ones, e.g., datetime parsing, so short-circuit
+        evaluation skips the expensive ones more often.
+
+        Parameters
+        ----------
+        tree : tuple
+            An expression tree returned by `parse_expressions`.
+        is_conjunct : bool
+            True if `tree` is the root, or is reached from the root
+            through ``and`` groups only.  Default is True.
+
+        Returns
+        -------
+        tuple
+            An expression tree with the same result for every record.
+
+        Notes
+        -----
+        - In an ``and`` group of conjuncts, every operand is sorted.  An
+          exception raised by any of them makes the whole predicate
+          False, the same as a False operand, so their order does not
+          change the result.  With `on_exception`, the exception of a
+          record that is rejected by a cheaper operand is not raised.
+        - Elsewhere, an operand that may raise an exception decides
+          whether the whole predicate returns False or raises, so it
+          keeps its place.  Only adjacent operands that never raise, see
+          `is_safe_expression`, are sorted among themselves.
+        - Operands of the same cost keep their written order.
+        """
+        if tree[0] == 'expr':
+            return tree
+
+        is_conjunct = is_conjunct and tree[0] == 'and'
+        children = [self.optimize_expressions(child, is_conjunct=is_conjunct)
+                    for child in tree[1]]
+        if is_conjunct:
+            return tree[0], sorted(children, key=self.get_cost)
+
+        result, run = [], []
+        for child in children:
+            if self.is_safe_expression(child):
+                run.append(child)
+            else:
+                result.extend(sorted(run, key=self.get_cost))
+                result.append(child)
+                run = []
+        result.extend(sorted(run, key=self.get_cost))
+        return tree[0], result
+
+    def evaluate_columns(self, rows, on_exception=False):
+        """
+        Evaluate the WHERE clause over many records, column by column.
+
+        Each expression is evaluated for every record not decided yet by
+        the earlier operands of its group before the next expression.  A
+        number comparison whose column holds only int or float values is
+        evaluated over an ``array('d')`` of the column, and a string
+        equality whose column holds only strings over the list of the
+        column.  It is not SIMD vectorization, as there is still one
+        Python comparison per record, but the predicate call, key lookup,
+        and operand conversion of each record are skipped.  Any other
+        expression falls back to its predicate, called record by record.
+
+        Parameters
+        ----------
+        rows : list of dict
+            The records to evaluate.
+        on_exception : bool
+            If True, an exception raised by a predicate is raised,
+            otherwise the record does not satisfy the clause.
+            Default is False.
+
+        Returns
+        -------
+        list of bool or None
+            The result of the predicate for each record, or None if the
+            clause is empty, or a predicate raises an exception and
+            `on_exception` is True, so the clause must be evaluated
+            record by record to raise the error of the first record.
+        """
+        tree = self.expressions_tree
+        if not tree:
+            return None
+
+        columns = dict()
+        failed = set()
+
+        def get_column(key):
+            if key not in columns:
+                values, kind = [row.get(key) for row in rows], None
+                if all(type(val) in (int, float) for val in values):
+                    try:
+                        values, kind = array('d', values), 'number'
+                    except OverflowError:
+                        pass
+                elif all(type(val) is str for val in values):
+                    # OpValidation rejects the get_value error sentinel
+                    sentinels = {val.upper() for val in values if len(val) == 13}
+                    kind = None if '__EXCEPTION__' in sentinels else 'str'
+                columns[key] = kind, values
+            return columns[key]
+
+        def get_vector(func):
+            # return (column, operator, other) of a predicate that never
+            # raises on its uniform column
+            keywords = getattr(func, 'keywords', dict())
+            op = getattr(operator, str(keywords.get('op')), None)
+            other = keywords.get('other')
+            if op and func.func == Predicate.compare_number and type(other) is float:
+                kind, values = get_column(keywords.get('key'))
+                return (values, op, other) if kind == 'number' else None
+            elif op and func.func == Predicate.compare and isinstance(other, str):
+                kind, values = get_column(keywords.get('key'))
+                return (values, op, other) if kind == 'str' else None
+            return None
+
+        def call(func, row):
+            # a single expression is the whole predicate, see compile_predicate
+            if tree[0] == 'expr':
+                return func(row, on_exception=on_exception)
+            return func(row)
+
+        def evaluate(node, positions):
+            if node[0] == 'expr':
+                vector = get_vector(node[1])
+                if vector:
+                    values, op, other = vector
+                    return [op(values[i], other) for i in positions]
+                result = []
+                for i in positions:
+                    try:
+                        result.append(bool(call(node[1], rows[i])))
+                    except Exception:   # noqa
+                        if on_exception:
+                            raise
+                        # an exception makes the whole predicate False
+                        failed.add(i)
+                        result.append(False)
+                return result
+
+            is_and = node[0] == 'and'
+            result = [is_and] * len(positions)
+            pending = list(range(len(positions)))
+            for child in node[1]:
+                if not pending:
+                    break
+                mask = evaluate(child, [positions[j] for j in pending])
+                for j, is_true in zip(pending, mask):
+                    if is_true is not is_and:
+                        result[j] = is_true
+                pending = [j for j, is_true in zip(pending, mask)
+                           if is_true is is_and and positions[j] not in failed]
+            return result
+
+        try:
+            mask = evaluate(tree, list(range(len(rows))))
+        except Exception:   # noqa
+            return None
+        return [is_true and i not in failed for i, is_true in enumerate(mask)]
+
+    def explain(self):
+        """
+        Describe the WHERE clause evaluation plan.
+
+        Returns
+        -------
+        str
+            One line per node of `expressions_tree` in evaluation order,
+            indented by depth, where a group shows its operator and an
+            expression shows its text, predicate, and cost, e.g.,
+            ``"AND\n  a eq 1  (compare_number, cost=2)"``.  An empty
+            string if the statement has no valid WHERE clause.
+        """
+        if not self.expressions_tree:
+            return ''
+
+        lines = []
+
+        def add_lines(node, depth):
+            indent = '  ' * depth
+            if node[0] == 'expr':
+                func = getattr(node[1], 'func', node[1])
+                name = getattr(func, '__name__', type(func).__name__)
+                fmt = '{}{}  ({}, cost={})'
+                lines.append(fmt.format(indent, node[2], name, self.get_cost(node)))
+            else:
+                lines.append('{}{}'.format(indent, node[0].upper()))
+                for child in node[1]:
+                    add_lines(child, depth + 1)
+
+        add_lines(self.expressions_tree, 0)
+        return '\n'.join(lines)
+
+    def compile_predicate(self, tree):
+        """
+        Compile an expression tree into a single predicate function.
+
+        The tree is turned into the source of one Python function whose
+        body is a single ``and``/``or`` expression over the predicates of
+        the leaves, and the source is compiled with `compile`.
+
+        Parameters
+        ----------
+        tree : tuple
+            An expression tree returned by `parse_expressions`.
+
+        Returns
+        -------
+        callable
+            The predicate of a single expression as is, otherwise a
+            function ``predicate(data, on_exception=...)`` that returns
+            False, or raises if `on_exception` is True, when an evaluated
+            expression raises an exception.
+        """
+        if tree[0] == 'expr':
+            return tree[1]
+
+        namespace = dict(false=Predicate.false)
+
+        def to_source(node):
+            if node[0] == 'expr':
+                name = 'p{}'.format(len(namespace) - 1)
+                namespace[name] = node[1]
+                return '{}(data)'.format(name)
+            sep = ' {} '.format(node[0])
+            return '({})'.format(sep.join(to_source(child) for child in node[1]))
+
+        lines = [
+            'def predicate(data, on_exception={!r}):'.format(bool(self.on_exception)),
+            '    try:',
+            '        return {}'.format(to_source(tree)),
+            '    except Exception as ex:',
+            '        if on_exception:',
+            '            raise ex',
+            '        return false(data)',
+        ]
+        code = compile('\n'.join(lines), '<where clause>', 'exec')
+        exec(code, namespace)
+        return namespace['predicate']
+
     def build_predicate(self, expressions):
         """
         Construct a predicate function from one or more expressions.
@@ -261,10 +898,10 @@ class SelectParser:
 
         Parameters
         ----------
-        expressions : str or list of str
+        expressions : str
             A single expression (e.g., `"age > 30"`) or multiple expressions
-            (e.g., `["age > 30", "name == 'Alice'"]`) to be combined into
-            a predicate.
+            joined by logical operators and grouped by parentheses (e.g.,
+            `"(age > 30 or_ age < 10) and_ name == Alice"`).
 
         Returns
         -------
@@ -272,59 +909,276 @@ class SelectParser:
             A predicate function that evaluates the given expression(s)
             against a record (dict). Returns True if the record satisfies
             all conditions, otherwise False.
+
+        Notes
+        -----
+        - The clause is tokenized by `tokenize_expressions`, parsed into
+          `expressions_tree` by `parse_expressions` with ``and_``/``&&``
+          binding tighter than ``or_``/``||``, reordered by
+          `optimize_expressions`, and compiled by `compile_predicate`.
+        - Evaluation short-circuits: the right operand of ``and_``/``&&``
+          is skipped when the left one is false, and the right operand of
+          ``or_``/``||`` is skipped when the left one is true.
+        - An exception raised by an evaluated operand is raised if
+          `on_exception` is True, otherwise the predicate returns False.
+        """
+        tokens = self.tokenize_expressions(expressions.strip())
+        try:
+            tree = self.parse_expressions(tokens)
+        except ValueError:
+            msg = (
+                '* Return False because of an invalid {!r} '
+                'expression.  Contact developer for this case.'
+            ).format(expressions)
+            self.logger.info(msg)
+            result = partial(Predicate.false)
+            return result
+
+        self.expressions_tree = self.optimize_expressions(tree)
+        result = self.compile_predicate(self.expressions_tree)
+        return result
+
+    def parse_trailing_clauses(self, text, is_where=False):
         """
-        def chain(data_, a_=None, b_=None, op_='', on_exception=False):
+        Parse the trailing ``GROUP BY``, ``ORDER BY``, and ``LIMIT`` clauses.
+
+        Parameters
+        ----------
+        text : str
+            The end of a select statement, i.e., the selected columns,
+            e.g., ``"name order by errors desc limit 10"``, or the
+            WHERE clause, e.g., ``"errors gt 0 order by errors desc"``.
+        is_where : bool
+            True if `text` is a WHERE clause.  Default is False.
+
+        Returns
+        -------
+        str
+            The text without the clauses.  The clauses are stored
+            in `group_by`, `order_by`, `limit`, and `offset`.
+
+        Notes
+        -----
+        - ``GROUP BY`` takes comma-separated columns.
+        - ``ORDER BY`` takes comma-separated columns, each optionally
+          followed by ``ASC`` (default) or ``DESC``.
+        - ``LIMIT n`` may be followed by ``OFFSET m`` to skip the first
+          ``m`` results.
+        - A WHERE clause ends at the ``group_by_``, ``order_by_``,
+          ``limit_``, or ``offset_`` keyword, the same way its
+          expressions are split on ``and_`` and ``or_``.
+        - Otherwise, a WHERE clause ends at a plain keyword, e.g.,
+          ``order by``, in the value of its last expression only if the
+          value before the keyword is a number, version, or datetime
+          and the whole value is not, e.g., ``errors gt 0 order by
+          errors``.  A text value such as ``note eq x order by y`` is
+          kept as written, and the ambiguity is logged.
+        - The clauses must be in the above order, otherwise `text` is
+          kept as written.
+        """
+        keywords = ['group by', 'order by', 'limit', 'offset']
+        plain_pattern = (r'(?i)(^| +)(?P<keyword>group[ _]+by_?|order[ _]+by_?'
+                         r'|limit_?|offset_?)(?= )')
+
+        def get_clauses(text_, pattern):
+            matches = list(re.finditer(pattern, text_))
+            if not matches:
+                return None
+
+            clauses_ = dict()
+            for i, match_ in enumerate(matches):
+                keyword = ' '.join(re.split('[ _]+', match_.group('keyword').lower())).strip()
+                end = matches[i + 1].start() if i + 1 < len(matches) else len(text_)
+                value = text_[match_.end():end].strip()
+                is_number = keyword not in ('limit', 'offset') or value.isdigit()
+                if not value or not is_number or keywords.index(keyword) < len(clauses_):
+                    return None
+                while keywords[len(clauses_)] != keyword:
+                    clauses_[keywords[len(clauses_)]] = None
+                clauses_[keyword] = value
+
+            if clauses_.get('offset') and not clauses_.get('limit'):
+                return None
+            return clauses_, matches[0].start()
+
+        def is_typed(expression):
+            # the value is a parsed number, version, or datetime
+            left_operands = list(self.left_operands)
             try:
-                result_a, result_b = a_(data_), b_(data_)
-                if op_ in ['or_', '||']:
-                    return result_a or result_b
-                elif op_ in ['and_', '&&']:
-                    return result_a and result_b
-                else:
-                    msg_ = (
-                        '* Return False because of an unsupported {!r} logical '
-                        'operator.  Contact developer to support this case.'
-                    ).format(op_)
-                    self.logger.info(msg_)
-                    return Predicate.false(data_)
-            except Exception as ex:
-                if on_exception:
-                    raise ex
-                else:
-                    return Predicate.false(data_)
+                func = self.get_predicate(expression)
+            except Exception:   # noqa
+                return False
+            finally:
+                self.left_operands = left_operands
+            typed_funcs = (Predicate.compare_number, Predicate.compare_datetime,
+                           Predicate.compare_version, Predicate.compare_semantic_version)
+            other = getattr(func, 'keywords', dict()).get('other')
+            return func.func in typed_funcs and not isinstance(other, str)
 
-        groups = []
-        start = 0
-        match = None
-        for match in re.finditer(' +(or_|and_|&&|[|]{2}) +', expressions, flags=re.I):
-            expr = match.string[start:match.start()]
-            op = match.group().strip().lower()
-            groups.extend([expr.strip(), op.strip()])
-            start = match.end()
+        if not is_where:
+            result = get_clauses(text, plain_pattern)
         else:
-            if groups and match:
-                expr = match.string[match.end():].strip()
-                groups.append(expr)
-
-        if groups:
-            total = len(groups)
-            if total % 2 == 1 and total > 2:
-                result = self.get_predicate(groups[0])
-                for case, expr in zip(groups[1:-1:2], groups[2::2]):
-                    func_b = self.get_predicate(expr)
-                    result = partial(chain, a_=result, b_=func_b, op_=case,
-                                     on_exception=self.on_exception)
-                return result
-            else:
+            pattern = r'(?i) +(?P<keyword>group_by_|order_by_|limit_|offset_)(?= )'
+            result = get_clauses(text, pattern)
+            token = self.tokenize_expressions(text)[-1]
+            expr = token[1] if token[0] == 'expr' and text.endswith(token[1]) else ''
+            for match in re.finditer(plain_pattern, expr) if result is None else []:
+                clauses = get_clauses(expr[match.start():], plain_pattern)
+                if not match.start() or clauses is None:
+                    continue
+                if is_typed(expr[:match.start()]) and not is_typed(expr):
+                    start = len(text) - len(expr) + match.start()
+                    result = clauses[0], start
+                    break
                 msg = (
-                    '* Return False because of an invalid {!r} '
-                    'expression.  Contact developer for this case.'
-                ).format(expressions)
+                    '* Keep {!r} as the value of {!r}.  End a WHERE clause '
+                    'with order_by_, group_by_, limit_, or offset_ instead.'
+                ).format(expr[match.start():].strip(), expr)
                 self.logger.info(msg)
-                result = partial(Predicate.false)
-                return result
-        else:
-            return self.get_predicate(expressions)
+                break
+
+        if result is None:
+            return text.strip()
+
+        clauses, start = result
+        if clauses.get('group by'):
+            self.group_by = re.split(' *, *', clauses['group by'])
+        for column in re.split(' *, *', clauses.get('order by') or ''):
+            if column:
+                match = re.match(r'(?i)(?P<name>.+?)( +(?P<dir>asc|desc))?$', column)
+                direction = (match.group('dir') or 'asc').lower()
+                self.order_by.append((match.group('name'), direction == 'desc'))
+        if clauses.get('limit'):
+            self.limit = int(clauses['limit'])
+            self.offset = int(clauses.get('offset') or 0)
+        return text[:start].strip()
+
+    def aggregate(self, rows):
+        """
+        Compute the aggregate columns of each ``GROUP BY`` group.
+
+        The rows are consumed one at a time and only one accumulator
+        per group is kept, so the rows are never held in memory.
+
+        Parameters
+        ----------
+        rows : iterable of dict
+            The records that satisfy the predicate.
+
+        Returns
+        -------
+        list of dict
+            One dictionary per group, in the order the groups are first
+            seen, mapping each selected column to its value.  Without
+            ``GROUP BY``, all rows form a single group, which is also
+            returned when there are no rows.
+
+        Notes
+        -----
+        - ``COUNT(*)`` counts rows, and ``COUNT(col)`` counts rows where
+          ``col`` is not missing or None.
+        - ``SUM``, ``MIN``, ``MAX``, and ``AVG`` convert values with
+          `OpValidation.to_number`, the same conversion as a ``WHERE``
+          number comparison, and skip values that cannot be converted.
+          They are None for a group without any number.
+        - A selected column that is not an aggregate takes its value from
+          the first row of the group, or None if there are no rows.
+        - An ``ORDER BY`` clause sorts the groups by their selected
+          columns, e.g., ``order by count(*) desc``.
+        """
+        columns = [column for column in self.columns if column is not None]
+        columns = columns or list(self.group_by)
+        aggregates = dict((column, (func, arg)) for column, func, arg in self.aggregates)
+        group_by = tuple(self.group_by)
+
+        groups = dict()
+        for row in rows:
+            key = tuple(utils.freeze(row.get(column)) for column in group_by)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = dict()
+                for column in columns:
+                    # aggregate state: [count, total, minimum, maximum]
+                    is_aggregate = column in aggregates
+                    group[column] = [0, 0, None, None] if is_aggregate else row.get(column)
+
+            for column, (func, arg) in aggregates.items():
+                state = group[column]
+                if arg == '*':
+                    state[0] += 1
+                    continue
+                value = row.get(arg)
+                if value is None:
+                    continue
+                if func == 'count':
+                    state[0] += 1
+                    continue
+                try:
+                    number = OpValidation.to_number(value)
+                except Exception:   # noqa
+                    continue
+                state[0] += 1
+                state[1] += number
+                if state[2] is None or number < state[2]:
+                    state[2] = number
+                if state[3] is None or number > state[3]:
+                    state[3] = number
+
+        if not groups and not group_by:
+            # an aggregate over no rows is still one row, e.g., count(*) is 0
+            groups[()] = dict((column, [0, 0, None, None] if column in aggregates else None)
+                              for column in columns)
+
+        result = []
+        for group in groups.values():
+            for column, (func, _) in aggregates.items():
+                count, total, minimum, maximum = group[column]
+                if func == 'count':
+                    group[column] = count
+                elif func == 'sum':
+                    group[column] = total if count else None
+                elif func == 'avg':
+                    group[column] = total / count if count else None
+                else:
+                    group[column] = minimum if func == 'min' else maximum
+            result.append(group)
+        return result
+
+    def get_order_key(self):
+        """
+        Return a function that computes the sort key of a record.
+
+        Returns
+        -------
+        callable
+            A function ``key(data)`` that returns a tuple with one item
+            per `order_by` column.  In either direction, numbers and
+            numeric strings come first, then other strings, then other
+            values, each group sorted by value; a missing, None, or NaN
+            value comes last.
+        """
+        columns = tuple(self.order_by)
+
+        def get_item(data, column, is_descending):
+            value = data.get(column)
+            if isinstance(value, str):
+                try:
+                    rank, value = 0, float(value)
+                except ValueError:
+                    rank = 1
+            elif isinstance(value, (int, float)):
+                rank = 0
+            else:
+                rank, value = 2, str(value)
+
+            if data.get(column) is None or value != value:
+                return 3, 0
+            return rank, DescendingKey(value) if is_descending else value
+
+        def key(data):
+            return tuple(get_item(data, column, is_descending)
+                         for column, is_descending in columns)
+        return key
 
     def parse_statement(self):
         """
@@ -339,18 +1193,29 @@ class SelectParser:
         Workflow
         --------
         1. Tokenize and validate the SELECT statement.
-        2. Identify column references (e.g., `name`, `age`).
-        3. Parse any filtering expressions (e.g., `age > 30`).
-        4. Build a callable predicate function for evaluation.
-        5. Store results in `self.columns` and `self.predicate`.
+        2. Split off trailing `GROUP BY`, `ORDER BY`, and
+           `LIMIT n [OFFSET m]` clauses from the end of the selected
+           columns or the WHERE clause, see `parse_trailing_clauses`.
+        3. Identify column references (e.g., `name`, `age`).
+        4. Parse any filtering expressions (e.g., `age > 30`).
+        5. Build a callable predicate function for evaluation.
+        6. Store results in `self.columns` and `self.predicate`.
 
         Returns
         -------
         None
-            Updates internal attributes (`columns`, `predicate`)
+            Updates internal attributes (`columns`, `predicate`,
+            `aggregates`, `group_by`, `order_by`, `limit`, `offset`)
             with parsed results.
+
+        Raises
+        ------
+        SelectParserError
+            If ``*`` is the argument of an aggregate other than ``count``,
+            e.g., ``sum(*)``, and `on_exception` is True.  Otherwise, the
+            error is logged and `predicate` returns False for any record.
         """
-        statement = self.select_statement
+        statement = self.select_statement.strip()
 
         if statement == '':
             return
@@ -369,11 +1234,36 @@ class SelectParser:
             select = re.sub('^ *select +', '', statement, flags=re.I).strip()
             expressions = None
 
+        if expressions:
+            expressions = self.parse_trailing_clauses(expressions, is_where=True)
+        else:
+            select = self.parse_trailing_clauses(select or '')
+
+        match = re.match(r'(?i)distinct( +|$)', select or '')
+        if match:
+            self.is_distinct = True
+            select = select[match.end():]
+
         if select:
             if re.match(r'(?i) *([*]|_+all_+) *$', select):
                 self.columns = []
             else:
                 self.columns = re.split(' *, *', select.strip(), flags=re.I)
+                for column in self.columns:
+                    pattern = r'(?i)(?P<func>count|sum|min|max|avg) *[(] *(?P<arg>.+?) *[)]$'
+                    match = re.match(pattern, column)
+                    if match:
+                        func, arg = match.group('func').lower(), match.group('arg')
+                        if arg == '*' and func != 'count':
+                            fmt = 'Failed to parse {!r} column, only count accepts *.'
+                            msg = fmt.format(column)
+                            if self.on_exception:
+                                raise SelectParserError(msg)
+                            self.logger.info('* Return False.  {}'.format(msg))
+                            self.aggregates = []
+                            self.predicate = partial(Predicate.false)
+                            return
+                        self.aggregates.append((column, func, arg))
 
         if expressions:
             self.predicate = self.build_predicate(expressions)
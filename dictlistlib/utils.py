@@ -16,6 +16,8 @@ convert_wildcard_to_regex(pattern: str, closed: bool = False) -> str
 
 foreach(data: Any, choice: str = 'keys')
     Return a set-like view of a dictionary’s keys, values, or items.
+freeze(value: Any) -> Hashable
+    Return a hashable equivalent of a value, e.g., a tuple for a list.
 
 get_data_as_tabular(data, columns=None, justify='left', missing='not_found') -> str
     Convert a list of dictionaries (or a single dictionary) into a tabular
@@ -26,6 +28,10 @@ print_data_as_tabular(data, columns=None, justify='left', missing='not_found') -
 
 Classes
 -------
+LRUCache
+    A thread-safe, size-bounded cache that evicts the least recently
+    used entry and counts hits and misses.
+
 BaseText(str)
     A string subclass that formats exceptions into readable text.
 
@@ -49,6 +55,7 @@ Notes
 """
 
 import re
+import threading
 from collections import OrderedDict
 from textwrap import wrap
 import typing
@@ -165,6 +172,171 @@ def foreach(data, choice='keys'):
         return node.items()
 
 
+def freeze(value):
+    """
+    Return a hashable equivalent of a value.
+
+    Equal values give equal results, so the result can be used as a
+    dictionary key or a set item in place of a list or dict value.
+
+    Parameters
+    ----------
+    value : Any
+        The value to freeze, e.g., a scalar, list, dict, or set.
+
+    Returns
+    -------
+    Hashable
+        `value` itself if it is hashable, a tuple of the frozen items of
+        a list or tuple, a frozenset of the frozen items of a set, or a
+        frozenset of the frozen ``(key, value)`` pairs of a dict.  A
+        type marker is added to a frozen list or dict, so that, e.g.,
+        ``[1, 2]`` and ``(1, 2)`` stay distinct.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return list, tuple(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), repr(value)
+    return value
+
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded cache with least-recently-used eviction.
+
+    The cache keeps at most `maxsize` entries. Reading or storing an
+    entry marks it as the most recently used one, and storing a new
+    entry into a full cache evicts the least recently used one. Every
+    lookup is counted as a hit or a miss.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries. Default is 128.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of entries.
+    hits : int
+        The number of lookups that found an entry.
+    misses : int
+        The number of lookups that did not find an entry.
+
+    Raises
+    ------
+    ArgumentValidationError
+        If `maxsize` is not an integer.
+    """
+    def __init__(self, maxsize=128):
+        validate_argument_type(int, maxsize=maxsize)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Return the cached value of a key and count a hit or a miss.
+
+        Parameters
+        ----------
+        key : hashable
+            The cache key.
+        default : Any, optional
+            The value returned when the key is not cached. Default is None.
+
+        Returns
+        -------
+        Any
+            The cached value, or `default` if the key is not cached.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store a value and evict the least recently used entries if full.
+
+        Parameters
+        ----------
+        key : hashable
+            The cache key.
+        value : Any
+            The value to cache.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, func):
+        """
+        Return the cached value of a key, creating and storing it if needed.
+
+        Parameters
+        ----------
+        key : hashable
+            The cache key.
+        func : callable
+            A function called with `key` to create the value on a miss.
+
+        Returns
+        -------
+        Any
+            The cached or newly created value.
+        """
+        marker = self._data     # never a cached value
+        value = self.get(key, marker)
+        if value is marker:
+            value = func(key)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Return the counters of the cache.
+
+        Returns
+        -------
+        dict
+            A dictionary with the ``hits``, ``misses``, ``size``, and
+            ``maxsize`` of the cache.
+        """
+        with self._lock:
+            result = dict(hits=self.hits, misses=self.misses,
+                          size=len(self._data), maxsize=self.maxsize)
+            return result
+
+
 class BaseText(str):
     """
     A string subclass that provides enhanced text representation.
@@ -71,6 +71,7 @@ import traceback
 import logging
 from datetime import datetime
 from compare_versions.core import verify_list as version_compare
+from compare_versions import schemes as version_schemes
 from dateutil.parser import parse
 from dateutil.parser import isoparse
 from dateutil.tz import gettz
@@ -392,6 +393,8 @@ class OpValidation:
 
     Methods
     -------
+    to_number(value) -> float
+        Convert a value to the float used by `compare_number`.
     compare_number(value, op, other, valid=True, on_exception=True) -> bool
         Compare two numeric values using the given operator (e.g., >, <, ==).
     compare(value, op, other, valid=True, on_exception=True) -> bool
@@ -438,6 +441,38 @@ class OpValidation:
       or "item must belong to a given set".
     - The `valid` flag allows inversion of checks for negative validation cases.
     """
+    @classmethod
+    def to_number(cls, value):
+        """
+        Convert a value to a float for numeric comparison.
+
+        The strings ``"true"`` and ``"false"`` (case-insensitive) are
+        treated as the booleans True and False before conversion.
+
+        Parameters
+        ----------
+        value : Any
+            The value to convert, e.g., an int, a float, a bool, or a
+            numeric string.
+
+        Returns
+        -------
+        float
+            The numeric value.
+
+        Raises
+        ------
+        ValueError
+            If a string value is not numeric.
+        TypeError
+            If the value cannot be converted to a float.
+        """
+        if type(value) is float:
+            return value
+        text = str(value).lower()
+        value = True if text == 'true' else False if text == 'false' else value
+        return float(value)
+
     @classmethod
     def compare_number(cls, value, op, other, valid=True, on_exception=True):
         """
@@ -503,11 +538,8 @@ class OpValidation:
                 fmt = 'Invalid {!r} operator for validating number.  It MUST be {}.'
                 raise ValidationOperatorError(fmt.format(op, valid_ops))
 
-            v, o = str(value).lower(), str(other).lower()
-            value = True if v == 'true' else False if v == 'false' else value
-            other = True if o == 'true' else False if o == 'false' else other
-            num = float(other)
-            value = float(value)
+            num = cls.to_number(other)
+            value = cls.to_number(value)
             result = getattr(operator, op)(value, num)
             return result if valid else not result
         except Exception as ex:
@@ -1986,6 +2018,61 @@ class VersionValidation:
             * PATCH version increments include backward-compatible bug fixes.
         """
     @classmethod
+    def parse_version(cls, version, scheme='string'):
+        """
+        Parse a version string into a comparable version object.
+
+        Parameters
+        ----------
+        version : str
+            The version string (e.g., "1.2.0").
+        scheme : str, optional
+            The versioning scheme, ``"string"`` (default) or ``"semver"``.
+
+        Returns
+        -------
+        object
+            A version object of the `compare_versions` scheme, which can
+            be passed as `other` to `compare_version` or
+            `compare_semantic_version` of the same scheme.
+
+        Raises
+        ------
+        Exception
+            If the version string is not valid for the scheme.
+        """
+        result = version_schemes.schemes[scheme](str(version))
+        return result
+
+    @classmethod
+    def do_version_compare(cls, value, op, other, scheme='string'):
+        """
+        Compare a version string with a version string or a parsed version.
+
+        Parameters
+        ----------
+        value : str
+            The version string to compare.
+        op : str
+            The textual comparison operator, e.g., "lt" or "eq".
+        other : str or object
+            The version string, or the version object returned by
+            `parse_version`, to compare against.
+        scheme : str, optional
+            The versioning scheme. Default is ``"string"``.
+
+        Returns
+        -------
+        bool
+            The result of the comparison.
+        """
+        if isinstance(other, str):
+            result = version_compare([value, other], comparison=op, scheme=scheme)
+            return result
+        result = getattr(operator, op)(cls.parse_version(value, scheme), other)
+        return result
+
+    @classmethod
     def compare_version(cls, value, op, other, valid=True, on_exception=True):
         """
         Compare two version strings using a specified operator.
@@ -2004,8 +2091,9 @@ class VersionValidation:
             The comparison operator. Supported values include:
             - Symbolic: "<", "<=", ">", ">=", "==", "!="
             - Textual: "lt", "le", "gt", "ge", "eq", "ne"
-        other : str
-            The version string to compare against (e.g., "1.3.0").
+        other : str or object
+            The version string to compare against (e.g., "1.3.0"), or
+            its version object returned by `parse_version`.
         valid : bool, optional
             Expected validation outcome. Default is True.
             - If True, returns True when the comparison result is correct.
@@ -2051,8 +2139,7 @@ class VersionValidation:
                 fmt = 'Invalid {!r} operator for validating version.  It MUST be {}.'
                 raise ValidationOperatorError(fmt.format(op, valid_ops))
 
-            value, other = str(value), str(other)
-            result = version_compare([value, other], comparison=op, scheme='string')
+            result = cls.do_version_compare(str(value), op, other, scheme='string')
             return result if valid else not result
         except Exception as ex:
             result = raise_exception_if(ex, on_exception=on_exception)
@@ -2078,8 +2165,9 @@ class VersionValidation:
             The comparison operator. Supported values include:
             - Symbolic: "<", "<=", ">", ">=", "==", "!="
             - Textual: "lt", "le", "gt", "ge", "eq", "ne"
-        other : str
-            The semantic version string to compare against (e.g., "1.3.0").
+        other : str or object
+            The semantic version string to compare against (e.g., "1.3.0"),
+            or its version object returned by ``parse_version(other, 'semver')``.
         valid : bool, optional
             Expected validation outcome. Default is True.
             - If True, returns True when the comparison result is correct.
@@ -2126,8 +2214,7 @@ class VersionValidation:
                 fmt = 'Invalid {!r} operator for validating version.  It MUST be {}.'
                 raise ValidationOperatorError(fmt.format(op, valid_ops))
 
-            value, other = str(value), str(other)
-            result = version_compare([value, other], comparison=op, scheme='semver')
+            result = cls.do_version_compare(str(value), op, other, scheme='semver')
             return result if valid else not result
         except Exception as ex:
             result = raise_exception_if(ex, on_exception=on_exception)
@@ -2184,6 +2271,7 @@ class DatetimeResult:
         self.fuzzy = self.to_bool(fuzzy, default=True)
         self.timezone = timezone
         self.tzinfos = dict()
+        self.parsed_datetime = None
         self.parse_timezone()
 
     def to_bool(self, value, default=False):    # noqa
@@ -2414,7 +2502,47 @@ class DatetimeValidation:
         return result
 
     @classmethod
-    def get_date(cls, datetime_value, options):
+    def parse_operand(cls, data):
+        """
+        Parse the expected datetime of a comparison once for many values.
+
+        Parameters
+        ----------
+        data : str
+            A datetime string with optional parsing directives, as
+            accepted by `parse_custom_date`.
+
+        Returns
+        -------
+        DatetimeResult
+            The parsing options, which can be passed as `other` to
+            `compare_datetime`.  `parsed_datetime` is only set if the
+            datetime string has a full date.
+
+        Raises
+        ------
+        ValueError
+            If the datetime string cannot be parsed.
+
+        Notes
+        -----
+        - A missing year, month, or day, e.g., ``10:00`` or ``Jun 14``,
+          is filled in from the current date by `get_date`.  Such a
+          string is left to `compare_datetime`, which parses it on each
+          comparison, so that the result does not depend on the day the
+          operand was parsed.
+        """
+        result = cls.parse_custom_date(data)
+        if result.data.strip():
+            # a missing date field takes its value from the default
+            parsed = cls.get_date(result.data, result, default=datetime(2000, 1, 1))
+            other = cls.get_date(result.data, result, default=datetime(2004, 2, 2))
+            if parsed == other:
+                result.parsed_datetime = parsed
+        return result
+
+    @classmethod
+    def get_date(cls, datetime_value, options, default=None):
         """
         Parse a datetime string into a `datetime.datetime` instance.
 
@@ -2437,6 +2565,10 @@ class DatetimeValidation:
                 Flag to interpret day before month (e.g., "15/12/2025").
             - fuzzy : bool
                 Flag to allow fuzzy parsing, ignoring unknown tokens.
+        default : datetime.datetime, optional
+            The datetime whose fields replace the missing fields of
+            `datetime_value`.  Default is None, i.e., the current date
+            at midnight.
 
         Returns
         -------
@@ -2472,7 +2604,8 @@ class DatetimeValidation:
                         nov(ember)?|
                         dec(ember)?)([0-9].*)"""
             datetime_value = re.sub(pattern, r'\1 \2 \12', datetime_value)
-            result = parse(datetime_value, dayfirst=options.dayfirst,
+            result = parse(datetime_value, default=default,
+                           dayfirst=options.dayfirst,
                            fuzzy=options.fuzzy, tzinfos=options.tzinfos)
             return result
 
@@ -2556,8 +2689,9 @@ class DatetimeValidation:
             The comparison operator. Supported values include:
             - Textual: "lt", "le", "gt", "ge", "eq", "ne"
             - Symbolic: "<", "<=", ">", ">=", "==", "!="
-        other : str
-            The second datetime string to compare against.
+        other : str or DatetimeResult
+            The second datetime string to compare against, or its parsed
+            form returned by `parse_operand`.
         valid : bool, optional
             Expected validation outcome. Default is True.
             - If True, returns True when the comparison result is correct.
@@ -2599,7 +2733,10 @@ class DatetimeValidation:
             op = 'gt' if op == '>' else 'ge' if op == '>=' else op
             op = 'eq' if op == '==' else 'ne' if op == '!=' else op
 
-            dt_parsed_result = DatetimeValidation.parse_custom_date(other)
+            if isinstance(other, DatetimeResult):
+                dt_parsed_result = other
+            else:
+                dt_parsed_result = DatetimeValidation.parse_custom_date(other)
 
             a_date_str, other_date_str = value, dt_parsed_result.data
 
@@ -2607,7 +2744,9 @@ class DatetimeValidation:
                 return False
 
             a_date = DatetimeValidation.get_date(a_date_str, dt_parsed_result)
-            other_date = DatetimeValidation.get_date(other_date_str, dt_parsed_result)
+            other_date = dt_parsed_result.parsed_datetime
+            if other_date is None:
+                other_date = DatetimeValidation.get_date(other_date_str, dt_parsed_result)
 
             result = DatetimeValidation.do_date_compare(a_date, op, other_date)
             return result if valid else not result
@@ -1,9 +1,15 @@
+import re
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
 from dictlistlib.collection import Element
 from dictlistlib.collection import LookupCls
+from dictlistlib.collection import MultiLookupCls
+from dictlistlib.collection import QueryPlan
 from dictlistlib.collection import List
 from dictlistlib.collection import ListIndexError
+from dictlistlib.parser import SelectParser
+from dictlistlib.exceptions import ArgumentValidationError
 
 
 @pytest.fixture
@@ -160,6 +166,75 @@ class TestElement:
         result = elm.find(lookup, select=select_statement)
         assert result == expected_result
 
+    @pytest.mark.parametrize(
+        "lookup,select_statement,expected_result",
+        [
+            ('title', '', ['ABC Widget']),
+            ('alignment', '', ['center', 'center']),
+            ('alignment=center', 'name where width eq 300', [{'name': 'text abc'}]),
+        ]
+    )
+    def test_find_a_lookup_with_lazy_element(
+        self, dict_data, lookup, select_statement, expected_result
+    ):
+        elm = Element(dict_data, lazy=True)
+        assert elm.has_children
+        assert elm.is_built is False
+
+        result = elm.find(lookup, select=select_statement)
+        assert result == expected_result
+        assert elm.is_built is True
+        assert result == Element(dict_data).find(lookup, select=select_statement)
+
+    @pytest.mark.parametrize("engine", ['element', 'raw'])
+    def test_find_a_lookup_in_deeply_nested_data(self, engine):
+        depth = 3000
+        data = {'name': 'leaf'}
+        for i in range(depth - 1, -1, -1):
+            data = {'name': 'level{}'.format(i), 'child': data}
+
+        elm = Element(data)
+        result = elm.find('name', engine=engine)
+        assert len(result) == depth + 1
+        assert result.first == 'level0'
+        assert result.last == 'leaf'
+
+    def test_iterfind_stops_traversal_at_limit(self, list_data):
+        elm = Element(list_data, lazy=True)
+        result = list(elm.iterfind('debug', limit=1))
+        assert result == ['on']
+        first_item, last_item = elm.children
+        assert first_item.is_built is True
+        assert last_item.is_built is False
+
+    def test_find_many_lookups(self, list_data):
+        elm_obj = Element(list_data)
+        queries = [('name', ''), 'width=gt(100)', ('debug', 'select *')]
+        expected_result = [
+            elm_obj.find('name'),
+            elm_obj.find('width=gt(100)'),
+            elm_obj.find('debug', select='select *'),
+        ]
+        assert elm_obj.find_many(queries) == expected_result
+
+    def test_compact_element_layout(self, list_data):
+        elm = Element(list_data, on_exception=True)
+        assert not hasattr(elm, '__dict__')
+        assert elm.on_exception is True
+        assert elm.lazy is False
+
+        first_item, last_item = elm.children
+        assert isinstance(elm.children, tuple)
+        assert first_item.index == '__index__0'
+        assert last_item.index == '__index__1'
+        assert first_item.value is None
+
+        debug = first_item.children[0].children[0]
+        assert debug.index == 'debug'
+        assert debug.type == 'str'
+        assert debug.value == 'on'
+        assert debug.is_leaf
+
 
 class TestLookupCls:
     @pytest.mark.parametrize(
@@ -636,6 +711,133 @@ class TestLookupCls:
         result = lkup_obj.is_right_matched(data)
         assert result == expected_result
 
+    def test_compiled_pattern_cache(self):
+        LookupCls.pattern_cache.clear()
+        lkup_obj = LookupCls('_iwildcard(full*)=David')
+        assert lkup_obj.left_pattern.pattern == lkup_obj.left
+        assert lkup_obj.right_pattern.pattern == lkup_obj.right
+        assert LookupCls.pattern_cache.stats()['misses'] == 2
+
+        other_obj = LookupCls('_iwildcard(full*)=John')
+        assert other_obj.left_pattern is lkup_obj.left_pattern
+        assert LookupCls.pattern_cache.stats() == dict(
+            hits=1, misses=3, size=3, maxsize=LookupCls.pattern_cache.maxsize
+        )
+
+        lkup_obj = LookupCls('key=is_empty()')
+        assert lkup_obj.right_pattern is None
+
+    @pytest.mark.parametrize(
+        "lookup,is_text_matched",
+        [
+            ('abc', True),
+            ('_text(foo.bar)', True),
+            ('_itext(abc)', True),
+            ('_wildcard(Gig*)', True),
+            ('_iwildcard(*gig)', True),
+            ('_wildcard(*a.c*)', True),
+            ('_wildcard(*)', True),
+            ('_itext(straße)', False),
+            ('_wildcard(a*c)', False),
+            ('_regex(a\\.*)', False),
+            ('_regex(ab?)', False),
+        ]
+    )
+    def test_lookup_text_matcher(self, lookup, is_text_matched):
+        lkup_obj = LookupCls('{0}={0}'.format(lookup))
+        assert (lkup_obj.left_matcher is not None) is is_text_matched
+        assert (lkup_obj.right_matcher is not None) is is_text_matched
+
+        words = ['', 'abc', 'ABC', 'xabcx', 'abc\n', 'a\nbc', 'foo.bar',
+                 'fooxbar', 'Gig0/1', 'gig', 'aGIG', 'a.c', 'K', 'Straße']
+        for word in words:
+            expected_result = bool(re.search(lkup_obj.left, word))
+            assert lkup_obj.is_left_matched(word) is expected_result
+            assert lkup_obj.is_right_matched(word) is expected_result
+
+    def test_invalid_regex_lookup(self):
+        lkup_obj = LookupCls('_regex(a[)')
+        assert lkup_obj.left_pattern is None
+        with pytest.raises(re.error):
+            lkup_obj.is_left_matched('a')
+
+
+class TestMultiLookupCls:
+    def test_match(self):
+        lookups = ['name', '_text(a.b)', '_wildcard(na*)', '=abc', 'name=x',
+                   '_iregex(^n)', '_itext(NAME)', '']
+        lookup_objs = [LookupCls(lookup) for lookup in lookups]
+        matcher = MultiLookupCls(lookup_objs)
+        keys = ['name', 'NAME', 'a.b', 'axb', 'nano', 'name\n', 'other', '', 1]
+        for key in keys:
+            expected_result = tuple(
+                i for i, lookup_obj in enumerate(lookup_objs)
+                if lookup_obj.is_left_matched(key)
+            )
+            assert matcher.match(key) == expected_result
+            assert matcher.match(key) == expected_result
+
+        assert matcher.match('name') == (0, 2, 3, 4, 6)
+        assert MultiLookupCls([]).match('name') == ()
+
+
+class TestQueryPlan:
+    def test_plan(self):
+        plan = QueryPlan('name=_wildcard(*abc*)', 'src where width gt 100')
+        assert plan.lookup_obj.left == '^name$'
+        assert plan.select_obj.columns == ['src']
+        assert callable(plan.select_obj.predicate)
+
+    def test_plan_cache(self):
+        QueryPlan.plan_cache.clear()
+        plan = QueryPlan.get('name', 'select name, width')
+        assert QueryPlan.get('name', 'select name, width') is plan
+        assert QueryPlan.get('name', 'select name, width', True) is not plan
+        assert QueryPlan.get('name', 'select name') is not plan
+        stats = QueryPlan.plan_cache.stats()
+        assert (stats['hits'], stats['misses'], stats['size']) == (1, 3, 3)
+
+    def test_resolve(self):
+        QueryPlan.plan_cache.clear()
+        plan = QueryPlan.resolve('name', 'select name')
+        assert QueryPlan.resolve('name', 'select name') is plan
+        assert QueryPlan.resolve(plan) is plan
+        with pytest.raises(ArgumentValidationError):
+            QueryPlan.resolve(plan, 'select name')
+
+        select_obj = SelectParser('select src where width gt 100')
+        select_obj.parse_statement()
+        new_plan = QueryPlan.resolve('name', select_obj)
+        assert new_plan.select_obj is select_obj
+        assert new_plan.select == 'select src where width gt 100'
+
+        other_plan = QueryPlan.get('src', 'select src', select_obj=plan.select_obj)
+        assert other_plan.select_obj is plan.select_obj
+
+    def test_find_with_parsed_query(self, list_data):
+        elm_obj = Element(list_data)
+        select = 'name where width gt 100'
+        expected_result = elm_obj.find('name', select=select)
+
+        select_obj = SelectParser(select, on_exception=False)
+        select_obj.parse_statement()
+        assert elm_obj.find('name', select=select_obj) == expected_result
+        plan = QueryPlan('name', select)
+        assert elm_obj.find(plan) == expected_result
+        assert list(elm_obj.iterfind(plan)) == expected_result
+        assert elm_obj.find_many([plan]) == [expected_result]
+
+    def test_plan_cache_across_threads(self, list_data):
+        elm_obj = Element(list_data)
+        expected_result = elm_obj.find('name', select='name where width gt 100')
+
+        def find(_):
+            return elm_obj.find('name', select='name where width gt 100')
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(find, range(20)))
+        assert all(result == expected_result for result in results)
+
 
 class TestList:
     def test_list_attribute(self):
@@ -1,4 +1,7 @@
 from dictlistlib import DLQuery
+from dictlistlib.collection import QueryPlan
+from dictlistlib.parser import SelectParser
+from dictlistlib.exceptions import SelectParserError
 import pytest
 
 
@@ -430,3 +433,378 @@ class TestQueryingDLQuery:
         result_a = dl_obj.find(lookup=lookup_a, select=select_a)
         result_b = dl_obj.find(node=result_a, lookup=lookup_b, select=select_b)
         assert result_b == expected_result
+
+    @pytest.mark.parametrize(
+        "lookup,select_statement",
+        [
+            ('=_iwildcard(*.png)', ''),
+            ('name=_iwildcard(*abc*)', 'src'),
+            ('alignment=center', 'name where width eq 300'),
+            ('alignment', 'name where width == 300 || data match (?i).+ abc'),
+            ('debug=off', 'window'),
+            ('name', 'select * where height le 500'),
+            ('widget', ''),
+        ]
+    )
+    def test_find_with_raw_engine(
+        self, another_list_data, lookup, select_statement
+    ):
+        dl_obj = DLQuery(another_list_data)
+        expected_result = dl_obj.find(lookup=lookup, select=select_statement)
+        result = dl_obj.find(lookup=lookup, select=select_statement, engine='raw')
+        assert result == expected_result
+
+    @pytest.mark.parametrize(
+        "lookup,select_statement,limit",
+        [
+            ('=_iwildcard(*.png)', '', None),
+            ('=_iwildcard(*.png)', 'src', 1),
+            ('name', 'select name, width where height le 500', 2),
+            ('name', '', 0),
+            ('', 'src where width gt 100', 5),
+        ]
+    )
+    @pytest.mark.parametrize("engine", ['element', 'raw'])
+    def test_iterfind(
+        self, another_list_data, lookup, select_statement, limit, engine
+    ):
+        dl_obj = DLQuery(another_list_data)
+        records = dl_obj.find(lookup=lookup, select=select_statement)
+        expected_result = records if limit is None else records[:limit]
+        result = dl_obj.iterfind(lookup=lookup, select=select_statement,
+                                 limit=limit, engine=engine)
+        assert list(result) == expected_result
+
+    def test_find_with_cached_element_tree(self, another_list_data):
+        dl_obj = DLQuery(another_list_data, cache=True)
+        assert dl_obj.find(lookup='debug') == ['on', 'off']
+        elm_obj = dl_obj._get_element(dl_obj.data)
+        assert dl_obj.find(lookup='title') == ['ABC Widget', 'XYZ Widget']
+        assert dl_obj._get_element(dl_obj.data) is elm_obj
+
+        dl_obj.data[1]['widget']['debug'] = 'on'
+        assert dl_obj.find(lookup='debug') == ['on', 'off']
+        dl_obj.invalidate()
+        assert dl_obj.find(lookup='debug') == ['on', 'on']
+        assert dl_obj._get_element(dl_obj.data) is not elm_obj
+
+    def test_find_with_verified_cached_element_tree(self, another_list_data):
+        dl_obj = DLQuery(another_list_data, cache=True, verify=True)
+        assert dl_obj.find(lookup='debug') == ['on', 'off']
+        elm_obj = dl_obj._get_element(dl_obj.data)
+
+        dl_obj.data.append({'debug': 'n/a'})
+        assert dl_obj.find(lookup='debug') == ['on', 'off', 'n/a']
+        assert dl_obj._get_element(dl_obj.data) is not elm_obj
+
+        dl_obj.data[1]['widget']['extra'] = {'debug': 'nested'}
+        assert dl_obj.find(lookup='debug') == ['on', 'off', 'n/a']
+        dl_obj.invalidate()
+        assert dl_obj.find(lookup='debug') == ['on', 'off', 'nested', 'n/a']
+
+        dl_obj.data = [{'debug': 'new'}]
+        assert dl_obj.find(lookup='debug') == ['new']
+
+    @pytest.mark.parametrize(
+        "lookup,select_statement",
+        [
+            ('name', ''),
+            ('name=_iwildcard(*abc*)', 'src'),
+            ('alignment=center', 'name where width eq 300'),
+            ('_text(debug)', 'window'),
+            ('widget', ''),
+            ('_wildcard(*th)', ''),
+            ('=_iwildcard(*.png)', ''),
+            ('debug=off', 'window'),
+            ('alignment=_text(center)', 'select *'),
+            ('name', 'name where alignment == center'),
+            ('_wildcard(*e)', 'select * where style eq bold'),
+            ('', 'name where alignment eq center'),
+            ('width=gt(100)', ''),
+            ('height=le(100)', 'name'),
+            ('name', 'name where width > 100'),
+            ('name', 'select * where height == 20'),
+        ]
+    )
+    @pytest.mark.parametrize("engine", ['element', 'raw'])
+    def test_find_with_key_index(
+        self, another_list_data, lookup, select_statement, engine
+    ):
+        dl_obj = DLQuery(another_list_data)
+        expected_result = dl_obj.find(lookup=lookup, select=select_statement)
+        dl_obj.build_index()
+        result = dl_obj.find(lookup=lookup, select=select_statement,
+                             engine=engine)
+        assert result == expected_result
+        result = dl_obj.iterfind(lookup=lookup, select=select_statement,
+                                 limit=1, engine=engine)
+        assert list(result) == expected_result[:1]
+
+    def test_find_with_stale_key_index(self, another_list_data):
+        dl_obj = DLQuery(another_list_data)
+        dl_obj.build_index()
+        dl_obj.data[1]['widget']['debug'] = 'on'
+        assert dl_obj.find(lookup='debug') == ['on', 'off']
+        dl_obj.invalidate()
+        assert dl_obj.find(lookup='debug') == ['on', 'on']
+
+        dl_obj.build_index()
+        dl_obj.data = [{'debug': 'new'}]
+        assert dl_obj.find(lookup='debug') == ['new']
+        assert dl_obj._index.data is dl_obj.data
+
+    @pytest.mark.parametrize("engine", ['element', 'raw'])
+    def test_find_with_rebuilt_key_index(self, another_list_data, engine):
+        dl_obj = DLQuery(another_list_data, cache=True, verify=True)
+        index = dl_obj.build_index()
+        assert dl_obj.find(lookup='debug=on', engine=engine) == ['on']
+
+        dl_obj.data.append({'debug': 'on', 'name': 'extra'})
+        rebuilt_index = dl_obj._get_index(dl_obj.data)
+        assert rebuilt_index is not index and len(rebuilt_index.get('debug')) == 3
+        assert dl_obj.find(lookup='debug=on', engine=engine) == ['on', 'on']
+        assert dl_obj.find(lookup='debug', select='name where debug == on',
+                           engine=engine)[-1] == {'name': 'extra'}
+
+        index = dl_obj._index
+        dl_obj.data[1]['widget']['debug'] = 'on'
+        dl_obj.invalidate()
+        assert dl_obj.find(lookup='debug=on', engine=engine) == ['on'] * 3
+        assert dl_obj._index is not index
+        assert [value for _, value in dl_obj._index.get('debug')] == ['on'] * 3
+
+    @pytest.mark.parametrize(
+        "select",
+        [
+            'id where price gt 20',
+            'id where price eq 10.5 or_ name ne b',
+            'id where (name eq a || name eq c) and_ size lt 3',
+            'id where name eq a and_ size match [0-9]+',
+            'id where size > 1 or_ price ne 10.5',
+            'id, name where price == 99 || (name == a && size >= 2)',
+            'id where name gt 1 or_ price lt 50',
+        ]
+    )
+    @pytest.mark.parametrize("on_exception", [False, True])
+    def test_find_with_columnar_where(self, select, on_exception):
+        rows = [
+            dict(id=1, price=10.5, name='a', size=1),
+            dict(id=2, price=20, name='b', size='2'),
+            dict(id=3, price=30.25, name='c', size=3),
+            dict(id=4, price=99, name='a'),
+            dict(id=5, price=float('nan'), name='__exception__', size=4),
+        ]
+        dl_obj = DLQuery(rows)
+        try:
+            expected_result = list(dl_obj.iterfind(lookup='id', select=select,
+                                                   on_exception=on_exception))
+        except Exception as ex:
+            with pytest.raises(type(ex)):
+                dl_obj.find(lookup='id', select=select, on_exception=on_exception)
+        else:
+            result = dl_obj.find(lookup='id', select=select, on_exception=on_exception)
+            assert result == expected_result
+
+    def test_find_as_tuples(self):
+        rows = [
+            dict(id=1, name='a', class_='x'),
+            dict(id=2, name='b'),
+            dict(id=3, name='c', class_='z'),
+        ]
+        dl_obj = DLQuery(rows)
+        result = dl_obj.find(lookup='id', select='name, class_ where id gt 0',
+                             as_tuples=True)
+        assert result == [('a', 'x'), ('c', 'z')]
+        assert result[1].name == 'c' and result[1].class_ == 'z'
+
+        result = list(dl_obj.iterfind(lookup='id', select='id, id',
+                                      as_tuples=True))
+        assert result == [(1, 1), (2, 2), (3, 3)]
+        assert result[0]._fields == ('id', '_1')
+
+    def test_find_with_parsed_select(self, another_list_data, monkeypatch):
+        select = 'src where width gt 100 and_ name ne parsed_once'
+        dl_obj = DLQuery(another_list_data)
+        calls = []
+        parse_statement = SelectParser.parse_statement
+
+        def counted_parse_statement(self_):
+            calls.append(self_.select_statement)
+            return parse_statement(self_)
+
+        monkeypatch.setattr(SelectParser, 'parse_statement', counted_parse_statement)
+        expected_result = dl_obj.find(select=select)
+        assert calls == [select]
+        assert len(expected_result) > 0
+
+        select_obj = SelectParser(select, on_exception=False)
+        select_obj.parse_statement()
+        assert dl_obj.find(select=select_obj) == expected_result
+        assert list(dl_obj.iterfind(select=select_obj)) == expected_result
+        plan = QueryPlan('src', select)
+        assert dl_obj.find(lookup=plan) == expected_result
+        assert dl_obj.find_many([plan, ('', select_obj)]) == [expected_result] * 2
+
+    @pytest.mark.parametrize(
+        "select,expected_result",
+        [
+            ('name order by errors desc limit 3', ['e0', 'e3', 'e1']),
+            ('name order by errors desc limit 2 offset 1', ['e3', 'e1']),
+            ('name order by errors', ['e4', 'e1', 'e3', 'e0', 'e2', 'e5']),
+            ('name where errors ne 7 order_by_ errors desc', ['e0', 'e3', 'e1', 'e4']),
+            ('select name where errors gt 0 order by errors desc limit 2', ['e0', 'e3']),
+            ('name where kind eq a and_ errors ge 3 limit 1 offset 1', ['e3']),
+            ('name order by kind, errors desc', ['e3', 'e1', 'e0', 'e4', 'e2', 'e5']),
+            ('name limit 2 offset 3', ['e3', 'e4']),
+            ('select * order by errors desc limit 1', [{'name': 'e0', 'errors': '12', 'kind': 'b'}]),
+        ]
+    )
+    def test_find_with_order_by_and_limit(self, select, expected_result):
+        rows = [
+            dict(name='e0', errors='12', kind='b'),
+            dict(name='e1', errors=3, kind='a'),
+            dict(name='e2', errors='n/a', kind='b'),
+            dict(name='e3', errors=7.5, kind='a'),
+            dict(name='e4', errors=0, kind='b'),
+            dict(name='e5', kind='b'),
+        ]
+        dl_obj = DLQuery(rows)
+        result = dl_obj.find(select=select)
+        if not select.startswith('select *'):
+            result = [row['name'] for row in result]
+        assert result == expected_result
+        assert list(dl_obj.iterfind(select=select)) == dl_obj.find(select=select)
+
+    @pytest.mark.parametrize(
+        "select",
+        [
+            'name where note eq eq limit 5',
+            'name where note eq x order by y',
+            'name where note eq 1 offset 2',
+            'name where note eq a group by b',
+        ]
+    )
+    def test_find_with_clause_words_in_operand(self, select):
+        value = select.split(' eq ', 1)[1]
+        rows = [dict(name='e0', note=value), dict(name='e1', note='x')]
+        dl_obj = DLQuery(rows)
+        assert dl_obj.find(select=select) == [{'name': 'e0'}]
+
+    @pytest.mark.parametrize(
+        "select,expected_result",
+        [
+            (
+                'kind, count(*), sum(errors), avg(errors) group by kind',
+                [
+                    {'kind': 'b', 'count(*)': 4, 'sum(errors)': 12.0, 'avg(errors)': 6.0},
+                    {'kind': 'a', 'count(*)': 2, 'sum(errors)': 10.5, 'avg(errors)': 5.25},
+                ]
+            ),
+            (
+                'kind, min(errors), max(errors) where errors gt 0 group_by_ kind '
+                'order_by_ max(errors) limit_ 1',
+                [{'kind': 'a', 'min(errors)': 3.0, 'max(errors)': 7.5}]
+            ),
+            (
+                'count(*), count(errors), max(errors)',
+                [{'count(*)': 5, 'count(errors)': 5, 'max(errors)': 12.0}]
+            ),
+            (
+                'kind, count(name) group by kind order by kind',
+                [{'kind': 'a', 'count(name)': 2}, {'kind': 'b', 'count(name)': 4}]
+            ),
+            ('count(*) where errors gt 100', [{'count(*)': 0}]),
+            (
+                'kind, count(*), sum(errors), avg(errors) where errors gt 100',
+                [{'kind': None, 'count(*)': 0, 'sum(errors)': None, 'avg(errors)': None}]
+            ),
+            ('count(*) group by kind', [{'count(*)': 4}, {'count(*)': 2}]),
+            ('kind, count(*) where errors gt 100 group_by_ kind', []),
+        ]
+    )
+    def test_find_with_group_by(self, select, expected_result):
+        rows = [
+            dict(name='e0', errors='12', kind='b'),
+            dict(name='e1', errors=3, kind='a'),
+            dict(name='e2', errors='n/a', kind='b'),
+            dict(name='e3', errors=7.5, kind='a'),
+            dict(name='e4', errors=0, kind='b'),
+            dict(name='e5', kind='b'),
+        ]
+        dl_obj = DLQuery(rows)
+        assert dl_obj.find(select=select) == expected_result
+        assert list(dl_obj.iterfind(select=select)) == expected_result
+        assert dl_obj.find_many([('', select)]) == [expected_result]
+
+        result = dl_obj.find(select=select, as_tuples=True)
+        assert result == [tuple(row.values()) for row in expected_result]
+
+    @pytest.mark.parametrize(
+        "select",
+        ['sum(*)', 'count(*), max(*)', 'kind, avg(*) where a gt 0 group by kind']
+    )
+    def test_find_with_invalid_aggregate(self, select):
+        dl_obj = DLQuery([{'a': 1, 'kind': 'x'}, {'a': 2, 'kind': 'y'}])
+        assert dl_obj.find(select=select) == []
+        assert list(dl_obj.iterfind(select=select)) == []
+        with pytest.raises(SelectParserError):
+            dl_obj.find(select=select, on_exception=True)
+        with pytest.raises(SelectParserError):
+            list(dl_obj.iterfind(select=select, on_exception=True))
+
+    @pytest.mark.parametrize(
+        "data,expected_result",
+        [
+            ([{'a': 1}, {'a': 2}, 'b', [{'a': 3}]], [{'count(*)': 2}]),
+            ({'a': {'b': 1}}, [{'count(*)': 1}]),
+            ([], [{'count(*)': 0}]),
+        ]
+    )
+    def test_find_count_without_lookup(self, data, expected_result):
+        dl_obj = DLQuery(data)
+        assert dl_obj.find(select='select count(*)') == expected_result
+        assert list(dl_obj.iterfind(select='count(*)')) == expected_result
+
+    @pytest.mark.parametrize(
+        "lookup,select,expected_result",
+        [
+            ('_wildcard([ab])', 'select distinct *', [0, 1, 2]),
+            ('_wildcard([ab])', 'select *', [0, 0, 1, 1, 2, 2]),
+            ('_wildcard([ab])', 'select distinct a, c', [{'a': 1, 'c': [1]}, {'a': 2, 'c': [1]}]),
+            ('b', 'select distinct', [1, 2]),
+            ('b', 'select distinct where a eq 1 order_by_ b desc limit_ 1', [2]),
+            ('', 'select distinct a, c limit 5 offset 1', [{'a': 2, 'c': [1]}]),
+        ]
+    )
+    def test_find_with_distinct(self, lookup, select, expected_result):
+        rows = [
+            {'a': 1, 'b': 1, 'c': [1]},
+            {'a': 1, 'b': 2, 'c': [1]},
+            {'a': 2, 'b': 1, 'c': [1]},
+        ]
+        dl_obj = DLQuery(rows)
+        result = dl_obj.find(lookup=lookup, select=select)
+        if select.endswith('*'):
+            result = [next(i for i, row in enumerate(rows) if row is item) for item in result]
+        assert result == expected_result
+        assert dl_obj.find(select='select distinct *') == rows
+
+    def test_find_many(self, another_list_data):
+        queries = [
+            ('=_iwildcard(*.png)', ''),
+            ('name=_iwildcard(*abc*)', 'src'),
+            ('alignment', 'name where width == 300 || data match (?i).+ abc'),
+            'debug',
+            ('', 'src where width gt 100'),
+            ('', ''),
+            ('unknown', ''),
+        ]
+        dl_obj = DLQuery(another_list_data)
+        expected_result = [
+            dl_obj.find(lookup=query) if isinstance(query, str)
+            else dl_obj.find(lookup=query[0], select=query[1])
+            for query in queries
+        ]
+        result = dl_obj.find_many(queries)
+        assert result == expected_result
+        assert dl_obj.find_many([]) == []
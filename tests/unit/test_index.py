@@ -0,0 +1,177 @@
+from dictlistlib.index import KeyIndex
+from dictlistlib.collection import Element
+from dictlistlib.collection import LookupCls
+from dictlistlib.validation import OpValidation
+import pytest
+
+
+@pytest.fixture
+def data():
+    obj = [
+        {'name': 'a', 'items': [{'name': 'b', 'id': 1}, {'id': 2}]},
+        ({'name': 'c', 1: 'int key'},),
+        {'nested': {'name': {'name': 'd'}}},
+    ]
+    yield obj
+
+
+class TestKeyIndex:
+    def test_build(self, data):
+        index = KeyIndex(data)
+        assert index.data is data
+        assert len(index) == 4
+        assert set(index.keys()) == {'name', 'items', 'id', 'nested'}
+        assert 'name' in index
+        assert 1 not in index
+        assert [val for _, val in index.get('id')] == [1, 2]
+        assert index.get('unknown') == []
+
+    def test_location_order(self, data):
+        index = KeyIndex(data)
+        values = [val for _, val in index.get('name')]
+        assert values == ['a', 'b', 'c', {'name': 'd'}, 'd']
+        parent, val = index.get('id')[0]
+        assert parent is data[0]['items'][0]
+
+    def test_deep_nesting(self):
+        data = node = dict()
+        for _ in range(3000):
+            node['key'] = node = dict()
+        index = KeyIndex(data)
+        assert len(index.get('key')) == 3000
+
+    @pytest.mark.parametrize(
+        "lookup,expected_result",
+        [
+            ('name', 'name'),
+            ('_text(a.b)', 'a.b'),
+            ('a b-c/d=x', 'a b-c/d'),
+            ('name=_iwildcard(*a*)', 'name'),
+            ('_regex(na.e)', None),
+            ('_wildcard(na*)', None),
+            ('_itext(name)', None),
+            ('=abc', None),
+            ('_regex(name\\$)', None),
+        ]
+    )
+    def test_left_literal(self, lookup, expected_result):
+        lkup_obj = LookupCls(lookup)
+        assert lkup_obj.left_literal == expected_result
+
+    @pytest.mark.parametrize(
+        "lookup",
+        ['name', 'name=_wildcard([ab])', 'id', '_regex(na.e)', 'nested']
+    )
+    def test_find_with_index(self, data, lookup):
+        elm_obj = Element(data)
+        index = KeyIndex(data)
+        expected_result = elm_obj.find(lookup)
+        assert elm_obj.find(lookup, index=index) == expected_result
+        assert elm_obj.find(lookup, select='name', index=index) == \
+            elm_obj.find(lookup, select='name')
+
+    def test_find_with_newline_key(self):
+        data = {'name': 1, 'sub': {'name\n': 2}}
+        elm_obj = Element(data)
+        index = KeyIndex(data)
+        assert elm_obj.find('name', index=index) == [1, 2]
+
+    def test_get_values(self, data):
+        index = KeyIndex(data)
+        values = index.get_values('name')
+        assert list(values) == ['a', 'b', 'c', 'd']
+        assert values['b'] == [(data[0]['items'][0], 'b')]
+        assert index.get_values('name') is values
+        assert index.get_values('id') == {}
+        assert index.get_values('unknown') == {}
+
+    @pytest.mark.parametrize(
+        "lookup,select_statement",
+        [
+            ('name=b', ''),
+            ('name=_text(d)', 'select *'),
+            ('name=x', ''),
+            ('id', 'where name == b'),
+            ('name', 'name where name eq c'),
+        ]
+    )
+    def test_find_with_value_index(self, data, lookup, select_statement):
+        elm_obj = Element(data)
+        index = KeyIndex(data)
+        expected_result = elm_obj.find(lookup, select=select_statement)
+        result = elm_obj.find(lookup, select=select_statement, index=index)
+        assert result == expected_result
+
+    def test_find_with_newline_value(self):
+        data = [{'name': 'a'}, {'name': 'a\n'}]
+        elm_obj = Element(data)
+        index = KeyIndex(data)
+        assert elm_obj.find('name=a', index=index) == ['a', 'a\n']
+
+    @pytest.mark.parametrize("op", ['lt', 'le', 'gt', 'ge', 'eq', 'ne'])
+    @pytest.mark.parametrize("other", ['3', 3.5, 'True', '-1', 'nan', '1e9'])
+    def test_compare_number(self, op, other):
+        values = [5, '3', 2.5, 'abc', None, True, 'false', 'nan', ' 7 ', 3]
+        data = [{'num': val} for val in values]
+        index = KeyIndex(data)
+        expected_result = [
+            (parent, val) for parent, val in index.get('num')
+            if OpValidation.compare_number(val, op, other, on_exception=False)
+        ]
+        assert index.compare_number('num', op, other) == expected_result
+
+    def test_compare_number_with_invalid_argument(self, data):
+        index = KeyIndex(data)
+        with pytest.raises(ValueError):
+            index.compare_number('id', 'gt', 'abc')
+        with pytest.raises(ValueError):
+            index.compare_number('id', 'match', '1')
+
+    @pytest.mark.parametrize(
+        "lookup,select_statement,on_exception",
+        [
+            ('id=gt(1)', '', False),
+            ('id=le(1)', 'name', False),
+            ('name', 'where id >= 1', False),
+            ('id', 'where id lt 2', False),
+            ('id', 'where id lt 2', True),
+        ]
+    )
+    def test_find_with_sorted_numbers(
+        self, data, lookup, select_statement, on_exception
+    ):
+        elm_obj = Element(data, on_exception=on_exception)
+        index = KeyIndex(data)
+        expected_result = elm_obj.find(lookup, select=select_statement)
+        result = elm_obj.find(lookup, select=select_statement, index=index)
+        assert result == expected_result
+
+    def test_get_summary(self, data):
+        index = KeyIndex(data, summary_size=3)
+        assert index.get_summary(data) == {'name', 'items', 'id', 'nested'}
+        assert index.get_summary(data[0]) == {'name', 'items', 'id'}
+        assert index.get_summary(data[0]['items']) == {'name', 'id'}
+        assert index.get_summary(data[1]) == {'name'}
+        assert index.get_summary(data[1][0]) is None
+        assert index.get_summary(data[2]['nested']) is None
+        assert KeyIndex(data).get_summary(data) is None
+
+    @pytest.mark.parametrize(
+        "lookup", ['_wildcard(na*)', '_regex(i.)', '_iwildcard(NESTED)', '=b']
+    )
+    @pytest.mark.parametrize("engine", ['element', 'raw'])
+    def test_find_with_key_summary(self, data, lookup, engine):
+        elm_obj = Element(data)
+        index = KeyIndex(data, summary_size=1)
+        expected_result = elm_obj.find(lookup)
+        result = elm_obj.find(lookup, engine=engine, index=index)
+        assert result == expected_result
+
+    def test_find_skips_subtree_by_key_summary(self):
+        big = {'key{}'.format(i): {'value': i} for i in range(100)}
+        data = {'big': big, 'small': {'name': 'a'}}
+        elm_obj = Element(data, lazy=True)
+        index = KeyIndex(data)
+        assert index.get_summary(big) is not None
+        assert elm_obj.find('_wildcard(nam*)', index=index) == ['a']
+        assert not elm_obj.children[0].is_built
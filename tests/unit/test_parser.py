@@ -1,6 +1,9 @@
 import pytest
+from collections import OrderedDict
+from functools import partial
 # from dictlistlib import DLQuery
 from dictlistlib.parser import SelectParser
+from dictlistlib.exceptions import SelectParserError
 
 
 @pytest.fixture
@@ -517,3 +520,435 @@ class TestSelectParser:
         obj.parse_statement()
         result = obj.predicate(data, on_exception=False)
         assert result is True
+
+    @pytest.mark.parametrize(
+        "statement,expected_result,expected_calls",
+        [
+            ('select a where a gt 1 and_ b eq 3', True, ['a gt 1', 'b eq 3']),
+            ('select a where a gt 2 and_ b eq 3', False, ['a gt 2']),
+            ('select a where a gt 1 or_ b eq 3', True, ['a gt 1']),
+            ('select a where a gt 2 || b eq 3', True, ['a gt 2', 'b eq 3']),
+            (
+                'select a where a gt 2 && b eq 3 || c match abc.+',
+                True,
+                ['a gt 2', 'c match abc.+']
+            ),
+            (
+                'select a where a gt 1 || b eq 3 && c match abc.+',
+                True,
+                ['a gt 1']
+            ),
+        ]
+    )
+    def test_parse_statement_short_circuit(self, data, statement,
+                                           expected_result, expected_calls):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        calls = []
+
+        def count(node):
+            if node[0] != 'expr':
+                return node[0], [count(child) for child in node[1]]
+            func, text = node[1], node[2]
+
+            def counted(data_):
+                calls.append(text)
+                return func(data_)
+            return 'expr', counted, text
+
+        predicate = obj.compile_predicate(count(obj.expressions_tree))
+        result = predicate(data, on_exception=False)
+        assert result is expected_result
+        assert calls == expected_calls
+
+    def test_parse_statement_short_circuit_with_exception(self, data):
+        obj = SelectParser('select a where a gt 1 or_ d gt 1')
+        obj.parse_statement()
+        assert obj.predicate(data, on_exception=True) is True
+
+        obj = SelectParser('select a where a gt 2 or_ d gt 1')
+        obj.parse_statement()
+        assert obj.predicate(data, on_exception=False) is False
+        with pytest.raises(Exception):
+            obj.predicate(data, on_exception=True)
+
+    @pytest.mark.parametrize(
+        "statement,expected_result",
+        [
+            ('select a where a gt 1 or_ b eq 4 and_ c eq nope', True),
+            ('select a where (a gt 1 or_ b eq 4) and_ c eq nope', False),
+            ('select a where a gt 5 || (c match (abc|def) xyz)', True),
+            ('select a where ((a gt 5) or_ (b eq 3 and_ (c match abc)))', True),
+            ('select a where (a gt 5 or_ b eq 3) && (c eq nope || b lt 4)', True),
+            ('select a where (a gt 1)', True),
+        ]
+    )
+    def test_parse_statement_precedence_and_parentheses(self, data, statement,
+                                                        expected_result):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        result = obj.predicate(data, on_exception=False)
+        assert result is expected_result
+
+    @pytest.mark.parametrize(
+        "expressions,expected_tokens",
+        [
+            (
+                '(a gt 1 or_ b eq version(2.0)) and_ c eq 3',
+                [('(',), ('expr', 'a gt 1'), ('op', 'or'),
+                 ('expr', 'b eq version(2.0)'), (')',), ('op', 'and'),
+                 ('expr', 'c eq 3')]
+            ),
+            (
+                'a gt 1) || b eq 2',
+                [('expr', 'a gt 1)'), ('op', 'or'), ('expr', 'b eq 2')]
+            ),
+        ]
+    )
+    def test_tokenize_expressions(self, expressions, expected_tokens):
+        obj = SelectParser('')
+        assert obj.tokenize_expressions(expressions) == expected_tokens
+
+    @pytest.mark.parametrize(
+        "statement,expected_type",
+        [
+            ('select a where a gt 1', float),
+            ('select a where b == 3', float),
+            ('select a where c eq abc xyz', str),
+            ('select a where c > version(1.2.3)', object),
+            ('select a where c > semantic_version(1.2.3)', object),
+            ('select a where c > date(2021-06-14)', object),
+            ('select a where c > semantic_version(abc)', str),
+        ]
+    )
+    def test_parse_statement_pre_parsed_operand(self, statement, expected_type):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        other = obj.predicate.keywords['other']
+        assert isinstance(other, expected_type)
+        if expected_type is object:
+            assert not isinstance(other, str)
+
+    @pytest.mark.parametrize(
+        "statement,expected_order",
+        [
+            (
+                'select a where c match abc.+ and_ b eq 3 and_ c eq abc xyz',
+                ['c eq abc xyz', 'b eq 3', 'c match abc.+']
+            ),
+            (
+                'select a where c > date(2021-06-14) or_ (c match x || c eq y)',
+                ['c eq y', 'c match x', 'c > date(2021-06-14)']
+            ),
+            (
+                'select a where c match abc.+ and_ a gt 1 and_ c eq abc xyz',
+                ['c eq abc xyz', 'a gt 1', 'c match abc.+']
+            ),
+            (   # an operand of an OR group that may raise keeps its place
+                'select a where c match abc.+ or_ d is unknown or_ c eq abc xyz',
+                ['c match abc.+', 'd is unknown', 'c eq abc xyz']
+            ),
+        ]
+    )
+    def test_optimize_expressions(self, data, statement, expected_order):
+        obj = SelectParser(statement, on_exception=False)
+        obj.parse_statement()
+
+        def texts(node):
+            if node[0] == 'expr':
+                return [node[2]]
+            return [text for child in node[1] for text in texts(child)]
+
+        assert texts(obj.expressions_tree) == expected_order
+
+    @pytest.mark.parametrize("on_exception", [True, False])
+    def test_optimize_expressions_with_raising_operands(self, on_exception):
+        statement = 'select a where ts gt date(2024-01-15) and_ errors gt 50 and_ st eq up'
+        obj = SelectParser(statement, on_exception=on_exception)
+        obj.parse_statement()
+        assert obj.explain() == (
+            'AND\n'
+            '  st eq up  (compare, cost=1)\n'
+            '  errors gt 50  (compare_number, cost=2)\n'
+            '  ts gt date(2024-01-15)  (compare_datetime, cost=5)'
+        )
+
+        # an OR group below the AND conjuncts keeps a raising operand in place
+        obj = SelectParser('select a where b eq 1 and_ (ts gt date(2024-01-15) or_ st eq up)',
+                           on_exception=True)
+        obj.parse_statement()
+        assert obj.explain().splitlines()[2:] == [
+            '  OR',
+            '    ts gt date(2024-01-15)  (compare_datetime, cost=5)',
+            '    st eq up  (compare, cost=1)',
+        ]
+
+        records = [
+            {'ts': '2024-02-01', 'errors': 51, 'st': 'up'},
+            {'ts': 'n/a', 'errors': 51, 'st': 'up'},
+            {'ts': 'n/a', 'errors': 'n/a', 'st': 'down'},
+            {'ts': '2024-01-01', 'errors': 51, 'st': 'up'},
+        ]
+        expected_obj = SelectParser(statement, on_exception=on_exception)
+        expected_obj.optimize_expressions = lambda tree: tree
+        expected_obj.parse_statement()
+        obj = SelectParser(statement, on_exception=on_exception)
+        obj.parse_statement()
+        for record in records:
+            expected_result = expected_obj.predicate(record, on_exception=False)
+            assert obj.predicate(record, on_exception=False) is expected_result
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            'select a where c match abc.+ and_ b eq 3 and_ c eq abc xyz',
+            'select a where c match x or_ b eq 4 or_ d eq 1',
+            'select a where (c match x or_ d gt 1) and_ b eq 3',
+            'select a where d gt 1 or_ (c match abc && b eq 3)',
+            'select a where c > date(2021-06-14) or_ c is not_empty',
+            'select a where c > date(2021-06-14) or_ c is empty',
+        ]
+    )
+    @pytest.mark.parametrize("on_exception", [True, False])
+    def test_optimize_expressions_keeps_result(self, statement, on_exception):
+        records = [
+            {'a': 1.2, 'b': 3, 'c': 'abc xyz'},
+            {'a': 1.2, 'b': 4, 'c': 'x', 'd': 'nan'},
+            {'b': 3, 'c': 'abc', 'd': 'abc'},
+            {'c': '2022-01-01', 'd': 2},
+            {},
+        ]
+        obj = SelectParser(statement, on_exception=False)
+        obj.parse_statement()
+        expected_obj = SelectParser(statement, on_exception=False)
+        expected_obj.optimize_expressions = lambda tree: tree
+        expected_obj.parse_statement()
+
+        for record in records:
+            try:
+                expected_result = expected_obj.predicate(record, on_exception=on_exception)
+            except Exception as ex:
+                with pytest.raises(type(ex)):
+                    obj.predicate(record, on_exception=on_exception)
+            else:
+                result = obj.predicate(record, on_exception=on_exception)
+                assert result is expected_result
+
+    def test_explain(self):
+        obj = SelectParser('select a where c match x and_ (b eq 3 or_ d gt 1)',
+                           on_exception=False)
+        obj.parse_statement()
+        assert obj.explain() == (
+            'AND\n'
+            '  c match x  (match, cost=3)\n'
+            '  OR\n'
+            '    b eq 3  (compare_number, cost=2)\n'
+            '    d gt 1  (compare_number, cost=2)'
+        )
+        assert SelectParser('select a').explain() == ''
+
+    @pytest.mark.parametrize(
+        "statement,expected_calls",
+        [
+            ('select a where a gt 1', 0),
+            ('select a where c eq abc xyz or_ b lt 3', 0),
+            ('select a where d gt 1', 3),
+            ('select a where d eq 1 && c match abc', 5),
+            ('select a where (c ne x || b eq 3) and_ a > date(2021-01-01)', 2),
+            ('select a where d gt 0 and_ a lt 5', 3),
+        ]
+    )
+    def test_evaluate_columns(self, statement, expected_calls):
+        rows = [
+            {'a': 1.2, 'b': 3, 'c': 'abc xyz', 'd': 1},
+            {'a': 0.5, 'b': 2.5, 'c': 'x', 'd': '1'},
+            {'a': 7, 'b': 3, 'c': 'abc', 'd': 'abc'},
+        ]
+        obj = SelectParser(statement, on_exception=False)
+        obj.parse_statement()
+        expected_result = [bool(obj.predicate(row, on_exception=False))
+                           for row in rows]
+
+        calls = []
+
+        class CountedPartial(partial):
+            def __call__(self, *args, **kwargs):
+                calls.append(args[0])
+                return super().__call__(*args, **kwargs)
+
+        def count_calls(node):
+            if node[0] == 'expr':
+                func = node[1]
+                return 'expr', CountedPartial(func.func, *func.args, **func.keywords), node[2]
+            return node[0], [count_calls(child) for child in node[1]]
+
+        obj.expressions_tree = count_calls(obj.expressions_tree)
+        assert obj.evaluate_columns(rows) == expected_result
+        assert len(calls) == expected_calls
+
+    @pytest.mark.parametrize(
+        "statement",
+        ['select a where d gt 1', 'select a where d gt 0 and_ a lt 5']
+    )
+    def test_evaluate_columns_with_exception(self, statement):
+        rows = [{'a': 1.2, 'd': 1}, {'a': 7, 'd': 'abc'}]
+        obj = SelectParser(statement, on_exception=True)
+        obj.parse_statement()
+        assert obj.evaluate_columns(rows) == [obj.predicate(row, on_exception=False) for row in rows]
+        assert obj.evaluate_columns(rows, on_exception=True) is None
+        with pytest.raises(ValueError):
+            obj.predicate(rows[1], on_exception=True)
+
+    @pytest.mark.parametrize(
+        "statement,expected_dict,expected_tuple",
+        [
+            ('select a, c', {'a': 1.2, 'c': 'abc xyz'}, (1.2, 'abc xyz')),
+            ('select b', {'b': 3}, (3,)),
+            ('select c, a, c', {'c': 'abc xyz', 'a': 1.2}, ('abc xyz', 1.2, 'abc xyz')),
+            ('select a, d', None, None),
+        ]
+    )
+    def test_get_projection(self, data, statement, expected_dict, expected_tuple):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        projection = obj.get_projection()
+        assert projection is obj.get_projection()
+        assert projection(data) == expected_dict
+        assert projection(OrderedDict(data)) == expected_dict
+        if expected_dict is not None:
+            assert type(projection(OrderedDict(data))) is OrderedDict
+
+        result = obj.get_projection(as_tuples=True)(data)
+        assert result == expected_tuple
+        if expected_tuple is not None:
+            assert result._fields[0] == obj.columns[0]
+
+    @pytest.mark.parametrize(
+        "statement,columns,order_by,limit,offset",
+        [
+            ('select a, b where a gt 1 order_by_ b desc, c limit_ 5 offset_ 2',
+             ['a', 'b'], [('b', True), ('c', False)], 5, 2),
+            ('select a ORDER BY a ASC', ['a'], [('a', False)], None, 0),
+            ('select a limit 10', ['a'], [], 10, 0),
+            ('select a order_by b limit 3 offset 1', ['a'], [('b', False)], 3, 1),
+            ('where a gt 1 ORDER_BY_ a', [None], [('a', False)], None, 0),
+            ('select a, b', ['a', 'b'], [], None, 0),
+            ('select a limit 5 order by a', ['a limit 5 order by a'], [], None, 0),
+            ('select a offset 5', ['a offset 5'], [], None, 0),
+        ]
+    )
+    def test_parse_statement_order_by_and_limit(self, statement, columns,
+                                                order_by, limit, offset):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        assert obj.columns == columns
+        assert obj.order_by == order_by
+        assert (obj.limit, obj.offset) == (limit, offset)
+
+    @pytest.mark.parametrize(
+        "statement,value,order_by,limit",
+        [
+            ('select a where a gt 0 order by a desc limit 3', 1, [('a', True)], 3),
+            ('select a where a > 0.5 limit 2 offset 1', 1, [], 2),
+            ('select a where b eq x && a lt 2 ORDER BY b', 1, [('b', False)], None),
+            ('select a where a ge date(2021-01-01) order by a', '2021-06-14', [('a', False)], None),
+            ('select a where a lt version(2.0) group by b', '1.5', [], None),
+        ]
+    )
+    def test_parse_statement_clause_after_where(self, statement, value,
+                                                order_by, limit):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        assert obj.predicate({'a': value, 'b': 'x'})
+        assert obj.order_by == order_by
+        assert obj.limit == limit
+        assert obj.left_operands[0] == ('b' if ' b eq ' in statement else 'a')
+
+    def test_parse_statement_ambiguous_clause_after_where(self, caplog):
+        obj = SelectParser('select a where note eq x order by y')
+        with caplog.at_level('INFO'):
+            obj.parse_statement()
+        assert obj.order_by == []
+        assert 'order_by_' in caplog.text
+
+    @pytest.mark.parametrize(
+        "statement,value,limit",
+        [
+            ('select a where note eq eq limit 5', 'eq limit 5', None),
+            ('select a where note eq x order by y', 'x order by y', None),
+            ('select a where note eq limit 2 offset 1', 'limit 2 offset 1', None),
+            ('select a where note eq x limit_ 5', 'x', 5),
+            ('select a where note eq a group by b', 'a group by b', None),
+        ]
+    )
+    def test_parse_statement_clause_words_in_operand(self, statement, value, limit):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        assert obj.predicate({'note': value})
+        assert obj.order_by == obj.group_by == []
+        assert obj.limit == limit
+
+    def test_get_order_key(self):
+        obj = SelectParser('select a order by a desc, b')
+        obj.parse_statement()
+        rows = [{'a': 'x', 'b': 2}, {'a': '10', 'b': 1}, {'b': 0},
+                {'a': 9, 'b': 2}, {'a': 10, 'b': 0}, {'a': float('nan')}]
+        result = sorted(rows, key=obj.get_order_key())
+        assert result == [rows[4], rows[1], rows[3], rows[0], rows[2], rows[5]]
+
+    def test_parse_statement_group_by(self):
+        obj = SelectParser('select kind, Count(*), avg(a) where a gt 1 '
+                           'group_by_ kind, b order_by_ kind limit_ 2')
+        obj.parse_statement()
+        assert obj.columns == ['kind', 'Count(*)', 'avg(a)']
+        assert obj.aggregates == [('Count(*)', 'count', '*'), ('avg(a)', 'avg', 'a')]
+        assert obj.group_by == ['kind', 'b']
+        assert obj.order_by == [('kind', False)]
+        assert obj.limit == 2
+        assert obj.is_aggregate_select
+
+        rows = iter([{'kind': 'x', 'a': '2', 'b': [1]}, {'kind': 'x', 'a': 'true', 'b': [1]},
+                     {'kind': 'x', 'a': 4, 'b': [2]}])
+        assert obj.aggregate(rows) == [
+            {'kind': 'x', 'Count(*)': 2, 'avg(a)': 1.5},
+            {'kind': 'x', 'Count(*)': 1, 'avg(a)': 4.0},
+        ]
+        assert obj.aggregate(iter([])) == []
+
+    def test_aggregate_without_rows(self):
+        obj = SelectParser('select kind, count(*), count(a), sum(a), min(a), max(a), avg(a)')
+        obj.parse_statement()
+        assert obj.aggregate(iter([])) == [{
+            'kind': None, 'count(*)': 0, 'count(a)': 0, 'sum(a)': None,
+            'min(a)': None, 'max(a)': None, 'avg(a)': None,
+        }]
+
+    @pytest.mark.parametrize(
+        "statement",
+        ['select sum(*)', 'select kind, min( * ) group by kind',
+         'select MAX(*)', 'avg(*) where a gt 1']
+    )
+    def test_parse_statement_invalid_aggregate(self, statement):
+        obj = SelectParser(statement)
+        with pytest.raises(SelectParserError):
+            obj.parse_statement()
+
+        obj = SelectParser(statement, on_exception=False)
+        obj.parse_statement()
+        assert obj.aggregates == []
+        assert obj.predicate({'a': 2, 'kind': 'x'}) is False
+
+    @pytest.mark.parametrize(
+        "statement,columns,is_distinct",
+        [
+            ('select distinct a, b where a gt 1', ['a', 'b'], True),
+            ('SELECT DISTINCT *', [], True),
+            ('select distinct', [None], True),
+            ('select distinct_name', ['distinct_name'], False),
+        ]
+    )
+    def test_parse_statement_distinct(self, statement, columns, is_distinct):
+        obj = SelectParser(statement)
+        obj.parse_statement()
+        assert obj.columns == columns
+        assert obj.is_distinct is is_distinct
@@ -2,6 +2,8 @@ from dictlistlib import utils
 import pytest
 import re
 
+from dictlistlib.exceptions import ArgumentValidationError
+
 ################################################################################
 # utils.convert_data_to_regex
 ################################################################################
@@ -139,3 +141,32 @@ def test_foreach_function(data, choice, expected_result):
     obj = utils.foreach(data, choice=choice)
     result = list(obj)
     assert result == expected_result
+
+
+class TestLRUCache:
+    def test_get_and_put(self):
+        cache = utils.LRUCache(maxsize=2)
+        assert cache.get('a') is None
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        assert 'b' not in cache
+        assert 'a' in cache and 'c' in cache
+        assert len(cache) == 2
+        assert cache.stats() == dict(hits=1, misses=1, size=2, maxsize=2)
+
+    def test_get_or_set(self):
+        cache = utils.LRUCache()
+        assert cache.get_or_set('ab', str.upper) == 'AB'
+        assert cache.get_or_set('ab', str.lower) == 'AB'
+        assert cache.get_or_set('x', lambda key: None) is None
+        assert cache.get_or_set('x', str.upper) is None
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        cache.clear()
+        assert cache.stats() == dict(hits=0, misses=0, size=0, maxsize=128)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ArgumentValidationError):
+            utils.LRUCache(maxsize='10')
@@ -3,6 +3,8 @@ from dictlistlib.validation import OpValidation
 from dictlistlib.validation import CustomValidation
 from dictlistlib.validation import VersionValidation
 from dictlistlib.validation import DatetimeValidation
+from datetime import datetime
+from dateutil.parser import _parser as dateutil_parser
 import pytest
 
 
@@ -395,6 +397,11 @@ class TestVersionValidation:
         chk = VersionValidation.compare_version(data, op, other, on_exception=False)
         assert chk is True
 
+        parsed_other = VersionValidation.parse_version(other)
+        chk = VersionValidation.compare_version(data, op, parsed_other,
+                                                on_exception=False)
+        assert chk is True
+
     @pytest.mark.parametrize(
         "data,op,other",
         [
@@ -419,6 +426,12 @@ class TestVersionValidation:
         )
         assert chk is True
 
+        parsed_other = VersionValidation.parse_version(other, 'semver')
+        chk = VersionValidation.compare_semantic_version(
+            data, op, parsed_other, on_exception=False
+        )
+        assert chk is True
+
 
 class TestDatetimeValidation:
     """Test class for validating Datetime comparison."""
@@ -492,3 +505,42 @@ class TestDatetimeValidation:
             data, op, other, on_exception=False
         )
         assert result is True
+
+        parsed_other = DatetimeValidation.parse_operand(other)
+        result = DatetimeValidation.compare_datetime(
+            data, op, parsed_other, on_exception=False
+        )
+        assert result is True
+
+    @pytest.mark.parametrize(
+        "other,expected_result",
+        [
+            ('2021-06-14 10:00', datetime(2021, 6, 14, 10)),
+            ('Mon Jun 14 03:00:00 PM 2021', datetime(2021, 6, 14, 15)),
+            ('10:00', None),
+            ('Jun 14 10:00', None),
+            ('Monday 10:00', None),
+        ]
+    )
+    def test_parse_operand(self, other, expected_result):
+        """Test only an operand with a full date is parsed up front."""
+        result = DatetimeValidation.parse_operand(other)
+        assert result.parsed_datetime == expected_result
+
+    def test_compare_datetime_with_parsed_time(self, monkeypatch):
+        """Test a time operand takes the current date of each comparison."""
+        class MockedDatetime(datetime):
+            current = datetime(2021, 6, 14, 23, 59)
+
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+
+        monkeypatch.setattr(dateutil_parser.datetime, 'datetime', MockedDatetime)
+        other = DatetimeValidation.parse_operand('10:00')
+        assert DatetimeValidation.compare_datetime('2021-06-14 11:00', 'gt', other)
+        assert DatetimeValidation.compare_datetime('11:00', 'gt', other)
+
+        MockedDatetime.current = datetime(2021, 6, 15, 0, 1)
+        assert not DatetimeValidation.compare_datetime('2021-06-14 11:00', 'gt', other)
+        assert DatetimeValidation.compare_datetime('2021-06-15 11:00', 'gt', other)